@@ -0,0 +1,375 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+import collections
+import multiprocessing
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
+from urllib.request import urlopen
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import detweeter
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.command import Command
+
+# offline throughput benchmark: serves a synthetic X (login, /<handle>/with_replies, status pages) using the same
+# data-testid markup LOCATORS targets, then runs login_to_twitter and the deletion loop against it headlessly
+
+HANDLE = "benchmark"
+OTHER_HANDLES = ["someone", "another_user", "reply_guy"]
+PAGE_SIZE = 20 # tweets per infinite-scroll page, like X's timeline
+RENDERED_ARTICLES = 60 # older articles are recycled (virtualized list) so the DOM stays bounded, as on X
+HEAP_SAMPLE_EVERY = 100 # WebDriver commands between browser memory samples
+
+MOCK_STYLE = """
+body { font-family: sans-serif; margin: 0 auto; max-width: 600px; }
+article { height: 110px; border-bottom: 1px solid #ccc; padding: 4px; overflow: hidden; }
+#menu, #sheet, #toast { position: fixed; top: 40%; left: 35%; background: #fff; border: 1px solid #000; padding: 10px; z-index: 10; }
+"""
+
+MOCK_NAV = """
+<nav>
+  <a data-testid="AppTabBar_Home_Link" href="/home">Home</a>
+  <a href="/{handle}">Profile</a>
+  <button data-testid="SideNav_NewTweet_Button">Post</button>
+  <button data-testid="SideNav_AccountSwitcher_Button">@{handle}</button>
+</nav>
+"""
+
+LOGIN_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Log in</title><style>{style}</style></head>
+<body>
+  <input name="text" autocomplete="username">
+  <button id="next"><span>Next</span></button>
+  <div id="password-step" style="display: none">
+    <input name="password" type="password">
+    <button id="login"><span>Log in</span></button>
+  </div>
+  <script>
+    document.getElementById('next').onclick = function () {{
+      setTimeout(function () {{ document.getElementById('password-step').style.display = 'block'; }}, {latency_ms});
+    }};
+    document.getElementById('login').onclick = function () {{
+      document.cookie = 'auth_token=benchmark; path=/';
+      setTimeout(function () {{ location.href = '/home'; }}, {latency_ms});
+    }};
+  </script>
+</body></html>
+"""
+
+HOME_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Home</title><style>{style}</style></head>
+<body>{nav}<main data-testid="primaryColumn"><p>Home timeline</p></main></body></html>
+"""
+
+# renders tweets with the markup detweeter's LOCATORS / SNAPSHOT_SCRIPT expect, plus the menu -> confirm -> DeleteTweet flow
+TIMELINE_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Timeline</title><style>{style}</style></head>
+<body>
+{nav}
+<main data-testid="primaryColumn"><div id="spacer"></div><div id="timeline"></div></main>
+<script>
+var MODE = {mode}, INITIAL = {initial}, RENDERED = {rendered};
+var cursor = 0, loading = false, done = false;
+var timeline = document.getElementById('timeline'), spacer = document.getElementById('spacer');
+function closeOverlays() {{
+  ['menu', 'sheet'].forEach(function (id) {{ var el = document.getElementById(id); if (el) el.remove(); }});
+}}
+function toast(text) {{
+  var el = document.createElement('div');
+  el.id = 'toast'; el.setAttribute('data-testid', 'toast'); el.textContent = text;
+  document.body.appendChild(el);
+  setTimeout(function () {{ el.remove(); }}, 3000);
+}}
+function confirmDelete(article, tweet) {{
+  var sheet = document.createElement('div');
+  sheet.id = 'sheet';
+  sheet.innerHTML = '<button data-testid="confirmationSheetConfirm"><span>Delete</span></button>';
+  sheet.firstChild.onclick = function () {{
+    closeOverlays();
+    fetch('/i/api/graphql/benchmark/DeleteTweet', {{method: 'POST', body: JSON.stringify({{variables: {{tweet_id: tweet.id}}}})}})
+      .then(function (response) {{ return response.json(); }})
+      .then(function (data) {{ if (data.errors) toast('Something went wrong. ' + data.errors[0].message); else article.remove(); }});
+  }};
+  document.body.appendChild(sheet);
+}}
+function openMenu(article, tweet) {{
+  closeOverlays();
+  var menu = document.createElement('div');
+  menu.id = 'menu';
+  menu.innerHTML = '<div role="menuitem"><span>Delete</span></div>';
+  menu.firstChild.onclick = function () {{ closeOverlays(); confirmDelete(article, tweet); }};
+  document.body.appendChild(menu);
+}}
+function render(tweet) {{
+  var article = document.createElement('article');
+  article.setAttribute('data-testid', 'tweet');
+  article.innerHTML =
+    '<div data-testid="User-Name"><span>' + tweet.name + '</span><span>@' + tweet.author + '</span></div>' +
+    '<a href="/' + tweet.author + '/status/' + tweet.id + '"><time datetime="' + tweet.created_at + '">' + tweet.created_at.slice(0, 10) + '</time></a>' +
+    '<div data-testid="tweetText">' + tweet.text + '</div>' +
+    '<button data-testid="retweet" aria-label="' + tweet.retweets + ' reposts. Repost">' + tweet.retweets + '</button>' +
+    '<button data-testid="like" aria-label="' + tweet.likes + ' Likes. Like">' + tweet.likes + '</button>' +
+    '<button data-testid="caret">...</button>' +
+    '<button data-testid="' + (tweet.bookmarked ? 'removeBookmark' : 'bookmark') + '">Bookmark</button>';
+  article.querySelector("[data-testid='caret']").onclick = function () {{ openMenu(article, tweet); }};
+  timeline.appendChild(article);
+}}
+function recycle() {{ // keep only the newest RENDERED articles in the DOM, spacer preserves scroll height
+  while (timeline.children.length > RENDERED) {{
+    var first = timeline.children[0];
+    spacer.style.height = (spacer.offsetHeight + first.offsetHeight) + 'px';
+    first.remove();
+  }}
+}}
+function loadMore() {{
+  if (loading || done || MODE !== 'timeline') return;
+  loading = true;
+  fetch('/api/timeline?cursor=' + cursor).then(function (response) {{ return response.json(); }}).then(function (page) {{
+    page.tweets.forEach(render);
+    cursor = page.next; done = page.done; loading = false;
+    recycle();
+  }});
+}}
+document.addEventListener('keydown', function (event) {{ if (event.key === 'Escape') closeOverlays(); }});
+window.addEventListener('scroll', function () {{
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 300) loadMore();
+}});
+INITIAL.forEach(render);
+if (MODE === 'status' && !INITIAL.length) {{ // X's page for a deleted or unknown status
+  timeline.innerHTML = '<div data-testid="error-detail"><span>Hmm...this page doesn&#39;t exist. Try searching for something else.</span></div>';
+}}
+loadMore();
+</script>
+</body></html>
+"""
+
+class MockTimeline: # server-side state: ordered tweets (newest first), deletions, failure injection
+    def __init__(self, size, other_rate, bookmark_rate, latency, failure_rate, seed):
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        self.tweets = []
+        for index in range(size):
+            author = rng.choice(OTHER_HANDLES) if rng.random() < other_rate else HANDLE
+            self.tweets.append({
+                'id': str(1700000000000000000 + size - index),
+                'author': author,
+                'name': author.replace('_', ' ').title(),
+                'created_at': (now - timedelta(hours=index)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                'text': f"synthetic tweet number {index}",
+                'bookmarked': author == HANDLE and rng.random() < bookmark_rate,
+                'likes': int(rng.paretovariate(1.5)) - 1, # mostly zero, a few popular ones, for rule filtering
+                'retweets': int(rng.paretovariate(2.5)) - 1,
+            })
+        self.by_id = {tweet['id']: tweet for tweet in self.tweets}
+        self.deleted = set()
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = rng
+        self.counters = collections.Counter()
+    def page(self, cursor):
+        tweets = []
+        while cursor < len(self.tweets) and len(tweets) < PAGE_SIZE:
+            tweet = self.tweets[cursor]
+            cursor += 1
+            if tweet['id'] not in self.deleted:
+                tweets.append(tweet)
+        self.counters['served'] += len(tweets)
+        return {'tweets': tweets, 'next': cursor, 'done': cursor >= len(self.tweets)}
+    def delete(self, tweet_id):
+        self.counters['delete_requests'] += 1
+        if self.rng.random() < self.failure_rate:
+            self.counters['delete_failures'] += 1
+            return {'errors': [{'message': "Rate limit exceeded", 'code': 88}]}
+        tweet = self.by_id.get(tweet_id)
+        if not tweet or tweet['author'] != HANDLE or tweet_id in self.deleted:
+            return {'errors': [{'message': "No status found with that ID.", 'code': 144}]}
+        self.deleted.add(tweet_id)
+        self.counters['deleted'] += 1
+        return {'data': {'delete_tweet': {'tweet_results': {}}}}
+    def summary(self):
+        return {'tweets': len(self.tweets), 'own': sum(1 for tweet in self.tweets if tweet['author'] == HANDLE), **self.counters}
+
+def make_handler(timeline):
+    class MockXHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args): # keep the benchmark output readable
+            pass
+        def send_body(self, body, content_type="text/html; charset=utf-8", status=200):
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        def send_page(self, template, **fields):
+            nav = MOCK_NAV.format(handle=HANDLE)
+            self.send_body(template.format(style=MOCK_STYLE, nav=nav, latency_ms=int(timeline.latency * 1000), **fields))
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [part for part in url.path.split('/') if part]
+            if url.path == "/login":
+                self.send_page(LOGIN_PAGE)
+            elif url.path in ("/", "/home"):
+                self.send_page(HOME_PAGE)
+            elif url.path == "/api/timeline":
+                time.sleep(timeline.latency)
+                cursor = int(parse_qs(url.query).get('cursor', ['0'])[0])
+                self.send_body(json.dumps(timeline.page(cursor)), "application/json")
+            elif url.path == "/api/stats":
+                self.send_body(json.dumps(timeline.summary()), "application/json")
+            elif len(parts) == 2 and parts[1] == "with_replies":
+                self.send_page(TIMELINE_PAGE, mode=json.dumps('timeline'), initial="[]", rendered=RENDERED_ARTICLES)
+            elif len(parts) == 3 and parts[1] == "status":
+                time.sleep(timeline.latency)
+                tweet = timeline.by_id.get(parts[2])
+                initial = [tweet] if tweet and tweet['id'] not in timeline.deleted else []
+                self.send_page(TIMELINE_PAGE, mode=json.dumps('status'), initial=json.dumps(initial), rendered=RENDERED_ARTICLES)
+            else:
+                self.send_body("not found", "text/plain", 404)
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if self.path.endswith("/DeleteTweet"):
+                time.sleep(timeline.latency)
+                self.send_body(json.dumps(timeline.delete(payload['variables']['tweet_id'])), "application/json")
+            else:
+                self.send_body("not found", "text/plain", 404)
+    return MockXHandler
+
+def serve_mock(size, options, connection): # runs in its own process so the mock's state never counts towards detweeter's memory
+    timeline = MockTimeline(size, options['other_rate'], options['bookmark_rate'], options['latency'], options['failure_rate'], options['seed'])
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(timeline))
+    connection.send(server.server_address[1])
+    server.serve_forever()
+
+def sample_browser_heap(driver): # samples the browser's JS heap every HEAP_SAMPLE_EVERY commands (command counts come from detweeter.metrics)
+    heap = {'peak': None, 'commands': 0}
+    execute = driver.execute # already timed and counted by detweeter.instrument_driver
+    raw_execute = type(driver).execute.__get__(driver) # the class's own execute, bypassing instrument_driver
+    def sampling_execute(command, params=None):
+        heap['commands'] += 1
+        if heap['commands'] % HEAP_SAMPLE_EVERY == 0:
+            try: # raw execute so the sample is neither timed nor counted
+                used = raw_execute(Command.W3C_EXECUTE_SCRIPT, {'script': "return performance.memory ? performance.memory.usedJSHeapSize : null;", 'args': []})['value']
+                if used is not None:
+                    heap['peak'] = max(heap['peak'] or 0, used)
+            except Exception:
+                pass
+        return execute(command, params)
+    driver.execute = sampling_execute
+    return heap
+
+def run_benchmark(size, args):
+    parent, child = multiprocessing.Pipe()
+    options = {'other_rate': args.other_rate, 'bookmark_rate': args.bookmark_rate, 'latency': args.latency, 'failure_rate': args.failure_rate, 'seed': args.seed}
+    server = multiprocessing.Process(target=serve_mock, args=(size, options, child), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{parent.recv()}"
+    settings = {
+        'handle': HANDLE,
+        'password': "benchmark",
+        'num_to_delete': args.count,
+        'browser': args.browser,
+        'headless': True,
+        'confirm_engine': args.confirm,
+        'base_url': base_url,
+        'driver_path': args.driver_path,
+        'rules': detweeter.load_rules(args.rules) if args.rules else None,
+        'plan': args.plan,
+    }
+    driver = None
+    journal = None
+    journal_dir = tempfile.TemporaryDirectory()
+    settings['plan_path'] = os.path.join(journal_dir.name, "plan.csv")
+    tracemalloc.start()
+    try:
+        driver = detweeter.build_driver(settings)
+        heap = sample_browser_heap(driver)
+        detweeter.metrics.reset() # session start-up is not part of the measured loop
+        wait = WebDriverWait(driver, 10)
+        pacer = detweeter.Pacer()
+        started = time.perf_counter()
+        if not detweeter.login_to_twitter(driver, wait, settings['handle'], settings['password'], pacer, base_url):
+            raise RuntimeError("Login against the mock server failed.")
+        login_seconds = time.perf_counter() - started
+        journal = detweeter.ProgressJournal(os.path.join(journal_dir.name, "benchmark.journal.sqlite"))
+        stats = detweeter.new_stats()
+        started = time.perf_counter()
+        if args.plan: # read-only pass over the same timeline, compare its tweets/s with a deletion run
+            detweeter.run_plan(driver, wait, settings, stats, pacer)
+        else:
+            detweeter.delete_from_timeline(driver, wait, settings, stats, journal, detweeter.RetryQueue(), pacer, detweeter.create_delete_watcher(driver, settings))
+        elapsed = time.perf_counter() - started
+        python_peak = tracemalloc.get_traced_memory()[1]
+        with urlopen(f"{base_url}/api/stats") as response:
+            server_stats = json.load(response)
+    finally:
+        tracemalloc.stop()
+        if driver:
+            driver.quit()
+        if journal:
+            journal.close()
+        journal_dir.cleanup()
+        server.terminate()
+    rows = detweeter.metrics.rows()
+    commands = sum(row['count'] for row in rows if row['kind'] == 'command')
+    return {
+        'size': size,
+        'deleted': stats['deleted'],
+        'planned': stats['planned'],
+        'errors': stats['errors'] - stats['recovered'],
+        'served': server_stats.get('served', 0),
+        'login_seconds': round(login_seconds, 2),
+        'elapsed_seconds': round(elapsed, 2),
+        'deletions_per_second': round(stats['deleted'] / elapsed, 3) if elapsed else 0.0,
+        'planned_per_second': round(stats['planned'] / elapsed, 3) if elapsed else 0.0,
+        'commands': commands,
+        'commands_per_tweet': round(commands / max(1, server_stats.get('served', 0)), 2),
+        'python_peak_mb': round(python_peak / 2 ** 20, 1),
+        'browser_heap_peak_mb': round(heap['peak'] / 2 ** 20, 1) if heap['peak'] else None,
+        'commands_by_type': {row['name']: row['count'] for row in rows if row['kind'] == 'command'},
+        'phases': [row for row in rows if row['kind'] == 'phase'],
+    }
+
+def print_report(results, plan=False): # plan runs report planned candidates in the deleted and del/s columns
+    done, rate = ('planned', 'planned_per_second') if plan else ('deleted', 'deletions_per_second')
+    print("\n" + "="*96)
+    print(f"{'tweets':>8} {'served':>8} {done:>8} {'errors':>7} {'seconds':>9} {'plan/s' if plan else 'del/s':>7} {'cmds/tweet':>11} {'py peak MB':>11} {'heap peak MB':>13}")
+    for result in results:
+        heap = result['browser_heap_peak_mb'] if result['browser_heap_peak_mb'] is not None else "n/a"
+        print(f"{result['size']:>8} {result['served']:>8} {result[done]:>8} {result['errors']:>7} {result['elapsed_seconds']:>9} "
+              f"{result[rate]:>7} {result['commands_per_tweet']:>11} {result['python_peak_mb']:>11} {heap:>13}")
+    print("="*96)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark detweeter's deletion loop against a local mock X timeline.")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma separated timeline sizes (default: %(default)s)")
+    parser.add_argument("--browser", choices=["Firefox", "Chrome"], default="Chrome")
+    parser.add_argument("--confirm", choices=["dom", "network"], default="dom", help="deletion confirmation engine")
+    parser.add_argument("--count", type=int, default=0, help="stop after this many deletions per run (0 = whole timeline)")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency per API call, seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of DeleteTweet calls answered with a rate-limit error")
+    parser.add_argument("--other-rate", type=float, default=0.3, help="fraction of timeline tweets written by other accounts")
+    parser.add_argument("--bookmark-rate", type=float, default=0.1, help="fraction of own tweets that are bookmarked")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--plan", action="store_true", help="run the read-only plan pass instead of deleting")
+    parser.add_argument("--rules", help="rules file to filter deletion candidates with (see compile_rules)")
+    parser.add_argument("--driver-path", help="local geckodriver/chromedriver binary")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args(argv)
+    results = []
+    for size in [int(size) for size in args.sizes.split(',')]:
+        print(f"Benchmarking {size} tweets ({args.browser}, {'plan only' if args.plan else args.confirm + ' confirmation'})...")
+        results.append(run_benchmark(size, args))
+    print_report(results, args.plan)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as json_file:
+            json.dump(results, json_file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,30 @@
+import time
+STARTUP_STARTED = time.perf_counter() # for startup_report, taken before anything else is imported
 import os
 import sys
-import time
+import csv
+import json
+import re
+import random
+import heapq
+import hashlib
 import queue
-import ctypes
+import sqlite3
+import getpass
+import argparse
+import logging
+import logging.handlers
+import urllib.parse
 import threading
-import tkinter as tk
-from tkinter import messagebox, scrolledtext
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
+import datetime
+import contextlib
+import collections
+# only the cheap Selenium pieces load up front — the WebDriver stack, webdriver_manager and the GUI stack are imported on first use
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, SessionNotCreatedException
+WebDriverWait = EC = None # bound by load_webdriver_support()
+tk = messagebox = scrolledtext = filedialog = ctypes = None # bound by load_gui_modules()
 
 LOCATORS = {
     "LOGIN_IDENTIFIER_INPUT": (By.NAME, "text"),
@@ -37,30 +44,248 @@ LOCATORS = {
     "DELETE_MENU_ITEM": (By.XPATH, "//div[@role='menuitem'][.//span[text()='Delete']]"),
     "DELETE_CONFIRM_BUTTON": (By.XPATH, "//button[@data-testid='confirmationSheetConfirm'][.//span[text()='Delete']]"),
     "BODY": (By.TAG_NAME, 'body'),
+    "EMPTY_STATE": (By.CSS_SELECTOR, "[data-testid='emptyState']"),
+    "STATUS_NOT_FOUND": (By.XPATH, "//*[@data-testid='error-detail' or @data-testid='emptyState'] | //span[contains(text(), \"page doesn't exist\")]"), # deleted/unknown status page
+}
+
+# single execute_script round trip describing every tweet article currently rendered — mirrors the TWEET_* locators above
+# /* RULES */ is replaced by the predicate compile_rules builds, so rule checks run in the page and only candidates carry an element reference back
+SNAPSHOT_SCRIPT = """
+var handle = (arguments[0] || '').toLowerCase();
+function count(article, testids) { // engagement count from the button label, e.g. '1,234 Likes. Like'
+    for (var i = 0; i < testids.length; i++) {
+        var button = article.querySelector("button[data-testid='" + testids[i] + "']");
+        if (button) {
+            var match = (button.getAttribute('aria-label') || '').match(/^([\\d,]+)/);
+            return match ? parseInt(match[1].replace(/,/g, ''), 10) : 0;
+        }
+    }
+    return 0;
+}
+function text(article) {
+    var node = article.querySelector("div[data-testid='tweetText']");
+    return node ? node.textContent : '';
+}
+function hasMedia(article) {
+    return article.querySelector("div[data-testid='tweetPhoto'], div[data-testid='videoPlayer']") !== null;
+}
+function isReply(article) { // the 'Replying to @...' line above the text, English UI
+    return Array.from(article.querySelectorAll('div')).some(function (div) {
+        return div.firstChild !== null && div.firstChild.nodeType === 3 && div.firstChild.textContent.trim() === 'Replying to';
+    });
 }
+var keep = /* RULES */;
+return Array.from(document.querySelectorAll("article[data-testid='tweet']")).map(function (article) {
+    var time = article.querySelector('a > time');
+    var permalink = time ? time.parentElement.href : null;
+    var match = permalink ? permalink.match(/\\/status\\/(\\d+)/) : null;
+    var author = Array.from(article.querySelectorAll("div[data-testid='User-Name'] span")).find(function (span) {
+        return span.textContent.startsWith('@');
+    });
+    var tweet = {
+        permalink: permalink,
+        status_id: match ? match[1] : null,
+        author: author ? author.textContent.slice(1) : null,
+        bookmarked: article.querySelector("button[data-testid='removeBookmark']") !== null,
+        created_at: time ? time.getAttribute('datetime') : null
+    };
+    var candidate = tweet.status_id !== null && !tweet.bookmarked && (tweet.author || '').toLowerCase() === handle;
+    tweet.rule = candidate ? keep(article, tweet) : null;
+    tweet.element = candidate && tweet.rule === null ? article : null;
+    return tweet;
+});
+"""
+
+BASE_URL = "https://x.com" # overridable with settings['base_url'], e.g. to point at the benchmark's mock server
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".detweeter") # per-user state kept between runs (progress journals, saved sessions, driver paths)
+DRIVER_CACHE_PATH = os.path.join(DATA_DIR, "drivers.json") # browser -> driver binary resolved on an earlier run
+HEADLESS_WINDOW_SIZE = (1400, 1000) # no screen to maximize to when headless
+LOG_FILE_PATH = os.path.join(DATA_DIR, "logs", "detweeter.log") # full log of every run, the GUI widget only keeps the tail
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+MAX_LOG_LINES = 5000 # lines kept in the log widget
+METRICS_DIR = os.path.join(DATA_DIR, "metrics") # per-run timing exports (JSON + CSV)
+PLANS_DIR = os.path.join(DATA_DIR, "plans") # default home of plan-mode manifests
+METRICS_RESERVOIR = 10000 # samples kept per phase/command for percentiles, counts and totals stay exact
+
+log_context = threading.local() # per-thread log prefix so output from parallel sessions can be told apart
+
+# adaptive pacing: kind -> (min seconds, seconds at the reference latency, max seconds)
+PACING_BOUNDS = {
+    'settle': (0.1, 0.5, 2.0), # after scrollIntoView, before opening the tweet menu
+    'delete': (0.1, 0.5, 2.0), # after a confirmed deletion, for the timeline to re-render
+    'escape': (0.1, 0.5, 2.0), # after closing a menu on a failed attempt
+    'login_check': (0.25, 1.0, 3.0), # between login verification probes
+}
+REFERENCE_LATENCY = 1.0 # server response time (seconds) the defaults above were tuned for
+SCROLL_TIMEOUT = 8.0 # longest wait for the next page of tweets after a scroll
+BACKOFF_BASE = 15.0 # first rate-limit backoff in seconds, doubled on each consecutive signal
+BACKOFF_MAX = 15 * 60.0
+TIMEOUTS_BEFORE_BACKOFF = 3 # consecutive TimeoutExceptions treated as throttling
+RETRY_BASE_DELAY = 30.0 # seconds before the first retry of a failed deletion, doubled per attempt
+RETRY_MAX_ATTEMPTS = 4 # including the original attempt
+SEARCH_EPOCH = "2006-03-21" # first day anything could have been posted, default start of the date-window walk
+SEARCH_WINDOW_DAYS = 30
+SEARCH_WINDOW_STALLS = 2 # windows are small and reloaded fresh, so the end is called sooner than on the profile page
+RULE_KEYS = ('keep_ids', 'after', 'before', 'min_likes', 'max_likes', 'min_retweets', 'max_retweets', 'text_pattern', 'media', 'kind') # see compile_rules
+compiled_snapshot_scripts = {} # rule set (as JSON) -> SNAPSHOT_SCRIPT with its predicate compiled in
+# Python-only regex syntax that re.compile accepts but a JS RegExp rejects: inline flags, (?P...) groups, comments, conditionals,
+# atomic groups, possessive quantifiers and \A / \Z; escapes and character classes are matched first so their contents are skipped
+JS_INCOMPATIBLE_REGEX = re.compile(r"\\.|\[(?:\\.|[^\\\]])*\]|\(\?(?:[aiLmsux-]+[:)]|P[<=>]|#|\(|>)|[*+?}]\+")
+
+# looks for X's error toasts / "Something went wrong" placeholders, only run after something already failed
+# tweet text is never inspected: a tweet saying "try again later" must not look like throttling
+RATE_LIMIT_SCRIPT = """
+var pattern = /something went wrong|rate limit|try again later|over the daily limit/i;
+var candidates = Array.from(document.querySelectorAll("[data-testid='toast'], [role='alert'], [data-testid='error-detail']"));
+document.querySelectorAll("[data-testid='primaryColumn'] button").forEach(function (button) { // the placeholder: a message with a Retry button, outside any tweet
+    if (button.textContent.trim() === 'Retry' && !button.closest('article') && button.parentElement) {
+        candidates.push(button.parentElement);
+    }
+});
+for (var i = 0; i < candidates.length; i++) {
+    if (candidates[i].closest('article')) {
+        continue;
+    }
+    var match = (candidates[i].innerText || '').match(pattern);
+    if (match) return match[0];
+}
+return null;
+"""
+
+DELETE_TWEET_ENDPOINT = "/DeleteTweet" # GraphQL mutation the delete confirmation fires, watched by the network confirm engine
 
-class QueueWriter: # helper to redirect stdout to queue
+class Timings: # count/total/max are exact, percentiles come from a bounded reservoir sample so long runs stay flat in memory
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.reservoir = []
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self.reservoir) < METRICS_RESERVOIR:
+            self.reservoir.append(seconds)
+        else:
+            slot = random.randrange(self.count)
+            if slot < METRICS_RESERVOIR:
+                self.reservoir[slot] = seconds
+    def percentile(self, percent):
+        ordered = sorted(self.reservoir)
+        return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))] if ordered else 0.0
+
+class Metrics: # per-run timings of every WebDriver command (by type) and of each phase of the hot path
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+    def reset(self):
+        with self.lock:
+            self.tables = {'phase': collections.defaultdict(Timings), 'command': collections.defaultdict(Timings)}
+            self.started = time.monotonic()
+    def record(self, kind, name, seconds):
+        with self.lock:
+            self.tables[kind][name].add(seconds)
+    @contextlib.contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record('phase', name, time.perf_counter() - started)
+    def rows(self):
+        with self.lock:
+            return [
+                {'kind': kind, 'name': name, 'count': timings.count, 'total_s': round(timings.total, 4),
+                 'p50_s': round(timings.percentile(50), 4), 'p95_s': round(timings.percentile(95), 4), 'max_s': round(timings.max, 4)}
+                for kind, table in self.tables.items()
+                for name, timings in sorted(table.items(), key=lambda item: -item[1].total)
+            ]
+    def deletions_per_minute(self, deleted):
+        minutes = (time.monotonic() - self.started) / 60
+        return deleted / minutes if minutes else 0.0
+    def report(self, deleted): # phase table for the summary block, slowest total first
+        print(f"Deletions/min:    {self.deletions_per_minute(deleted):.1f}")
+        print(f"{'phase':<22}{'count':>7}{'p50':>8}{'p95':>8}{'max':>8}{'total':>9}")
+        for row in self.rows():
+            if row['kind'] == 'phase':
+                print(f"{row['name']:<22}{row['count']:>7}{row['p50_s']:>8.2f}{row['p95_s']:>8.2f}{row['max_s']:>8.2f}{row['total_s']:>9.1f}")
+        commands = [row for row in self.rows() if row['kind'] == 'command']
+        print(f"WebDriver commands: {sum(row['count'] for row in commands)} in {sum(row['total_s'] for row in commands):.1f}s")
+    def export(self, path_prefix, deleted): # writes <prefix>.json and <prefix>.csv, returns the JSON path
+        rows = self.rows()
+        os.makedirs(os.path.dirname(path_prefix) or ".", exist_ok=True)
+        with open(f"{path_prefix}.json", 'w', encoding='utf-8') as json_file:
+            json.dump({'deleted': deleted, 'elapsed_s': round(time.monotonic() - self.started, 2),
+                       'deletions_per_minute': round(self.deletions_per_minute(deleted), 2), 'timings': rows}, json_file, indent=2)
+        with open(f"{path_prefix}.csv", 'w', encoding='utf-8', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=['kind', 'name', 'count', 'total_s', 'p50_s', 'p95_s', 'max_s'])
+            writer.writeheader()
+            writer.writerows(rows)
+        return f"{path_prefix}.json"
+
+metrics = Metrics() # module-wide so the hot path can be timed without threading another argument through it, reset at the start of each run
+
+def instrument_driver(driver): # times every WebDriver command by type (find element, execute script, get, ...)
+    execute = driver.execute
+    def timed_execute(command, params=None):
+        started = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            metrics.record('command', command, time.perf_counter() - started)
+    driver.execute = timed_execute
+    return driver
+
+class QueueWriter: # helper to redirect stdout to queue, one item per complete line rather than per print() fragment
     def __init__(self, queue):
         self.queue = queue
+        self.pending = threading.local() # partial line per thread, so parallel sessions never interleave mid-line
     def write(self, text):
-        self.queue.put(text)
-    def flush(self): # needed for sys.stdout compatibility
-        pass
+        buffer = getattr(self.pending, 'text', '') + text
+        lines = buffer.split('\n')
+        self.pending.text = lines.pop()
+        if lines:
+            prefix = getattr(log_context, 'prefix', '')
+            self.queue.put(''.join(f"{prefix}{line}\n" if line.strip() else "\n" for line in lines))
+    def flush(self): # needed for sys.stdout compatibility, also pushes out an unterminated line
+        text = getattr(self.pending, 'text', '')
+        if text:
+            self.pending.text = ''
+            self.queue.put(getattr(log_context, 'prefix', '') + text)
+
+def open_file_log(path=LOG_FILE_PATH, name="detweeter"): # rotating on-disk copy of everything shown in the log widget (batch accounts get their own file)
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.terminator = ""
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
 
 class DetweeterApp:
     def __init__(self, root):
         self.root = root
         self.thread = None
+        self.warmup = None # browser launched in the background, handed to the next run
         self.log_queue = queue.Queue()
+        self.file_log = open_file_log()
         self.loaded_font_paths = [] # track loaded fonts for cleanup
         self.validate_handle_cmd = (self.root.register(self._validate_length), '%P', 15) # handles are <= 15 chars
         self.validate_password_cmd = (self.root.register(self._validate_length), '%P', 50) # passwords are <= 50 chars
         self.validate_num_cmd = (self.root.register(self._validate_numeric), '%P', 4) # limit to 4 digits (9,999)
+        self.validate_sessions_cmd = (self.root.register(self._validate_numeric), '%P', 2) # limit to 2 digits (99 browser sessions)
         self.setup_gui()
         self.root.grid_rowconfigure(1, weight=1) # configure main window resizing behavior
         self.root.grid_columnconfigure(0, weight=1)
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.start_warmup()
     def _on_closing(self): # cleanup handler for when application window is closed
+        if self.warmup:
+            self.warmup.discard()
         if sys.platform == 'win32' and self.loaded_font_paths:
             gdi32 = ctypes.windll.gdi32
             for font_path in self.loaded_font_paths:
@@ -143,10 +368,16 @@ class DetweeterApp:
         browser_frame = tk.Frame(content_frame, bg=BG_COLOR)
         browser_frame.grid(row=2, column=1, sticky='w', pady=5)
         self.browser_choice = tk.StringVar(value="Firefox")
-        self.firefox_rb = tk.Radiobutton(browser_frame, text="Firefox", variable=self.browser_choice, value="Firefox", **rb_style)
+        self.firefox_rb = tk.Radiobutton(browser_frame, text="Firefox", variable=self.browser_choice, value="Firefox", command=self.start_warmup, **rb_style)
         self.firefox_rb.pack(side='left', padx=5)
-        self.chrome_rb = tk.Radiobutton(browser_frame, text="Chrome", variable=self.browser_choice, value="Chrome", **rb_style)
+        self.chrome_rb = tk.Radiobutton(browser_frame, text="Chrome", variable=self.browser_choice, value="Chrome", command=self.start_warmup, **rb_style)
         self.chrome_rb.pack(side='left', padx=5)
+        tk.Label(browser_frame, text="Sessions", **label_style).pack(side='left', padx=(20, 5))
+        sessions_entry_style = entry_style.copy()
+        sessions_entry_style['width'] = 3
+        self.sessions_entry = tk.Entry(browser_frame, **sessions_entry_style, validate='key', validatecommand=self.validate_sessions_cmd)
+        self.sessions_entry.pack(side='left')
+        self.sessions_entry.insert(0, "1")
         # input fields and labels
         tk.Label(content_frame, text="Handle (@)", **label_style).grid(row=3, column=0, sticky='w', padx=5, pady=10)
         self.handle_entry = tk.Entry(content_frame, **entry_style, validate='key', validatecommand=self.validate_handle_cmd)
@@ -171,6 +402,48 @@ class DetweeterApp:
         self.num_entry.pack(side='left')
         self.num_entry.insert(0, "10")
         tk.Label(controls_frame, text="tweets", **label_style).pack(side='left', padx=5)
+        archive_frame = tk.Frame(delete_frame, bg=BG_COLOR) # archive mode: visit status ids from a downloaded X archive instead of scrolling
+        archive_frame.grid(row=1, column=1, sticky='ew', pady=(10, 0))
+        self.archive_var = tk.BooleanVar(value=False)
+        self.archive_cb = tk.Checkbutton(archive_frame, text="From archive", variable=self.archive_var, command=self.toggle_archive_state, **rb_style)
+        self.archive_cb.pack(side='left', padx=5)
+        self.archive_path_var = tk.StringVar(value="")
+        archive_entry_style = entry_style.copy()
+        archive_entry_style['width'] = 18
+        archive_entry_style['readonlybackground'] = ENTRY_BG_COLOR
+        self.archive_entry = tk.Entry(archive_frame, textvariable=self.archive_path_var, **archive_entry_style)
+        self.archive_entry.pack(side='left', padx=(10, 5))
+        self.archive_button = tk.Button(archive_frame, text="Browse", command=self.choose_archive, font=FONT_CONTROLS, bg=ENTRY_BG_COLOR, fg=FG_COLOR, relief='flat', borderwidth=0, activebackground=BTN_HOVER_COLOR, activeforeground="white")
+        self.archive_button.pack(side='left', padx=5)
+        self.toggle_archive_state()
+        rules_frame = tk.Frame(delete_frame, bg=BG_COLOR) # rules file: JSON object narrowing which of your tweets get deleted, see compile_rules
+        rules_frame.grid(row=2, column=1, sticky='ew', pady=(10, 0))
+        self.rules_var = tk.BooleanVar(value=False)
+        self.rules_cb = tk.Checkbutton(rules_frame, text="Rules file", variable=self.rules_var, command=self.toggle_rules_state, **rb_style)
+        self.rules_cb.pack(side='left', padx=5)
+        self.rules_path_var = tk.StringVar(value="")
+        self.rules_entry = tk.Entry(rules_frame, textvariable=self.rules_path_var, **archive_entry_style)
+        self.rules_entry.pack(side='left', padx=(24, 5))
+        self.rules_button = tk.Button(rules_frame, text="Browse", command=self.choose_rules, font=FONT_CONTROLS, bg=ENTRY_BG_COLOR, fg=FG_COLOR, relief='flat', borderwidth=0, activebackground=BTN_HOVER_COLOR, activeforeground="white")
+        self.rules_button.pack(side='left', padx=5)
+        self.toggle_rules_state()
+        options_frame = tk.Frame(delete_frame, bg=BG_COLOR)
+        options_frame.grid(row=3, column=1, sticky='ew', pady=(10, 0))
+        self.network_confirm_var = tk.BooleanVar(value=False)
+        self.network_confirm_cb = tk.Checkbutton(options_frame, text="Confirm via network (Chrome)", variable=self.network_confirm_var, command=self.start_warmup, **rb_style)
+        self.network_confirm_cb.pack(side='left', padx=5)
+        self.headless_var = tk.BooleanVar(value=False)
+        self.headless_cb = tk.Checkbutton(options_frame, text="Headless", variable=self.headless_var, command=self.start_warmup, **rb_style)
+        self.headless_cb.pack(side='left', padx=5)
+        self.reuse_session_var = tk.BooleanVar(value=True)
+        self.reuse_session_cb = tk.Checkbutton(options_frame, text="Remember login", variable=self.reuse_session_var, **rb_style)
+        self.reuse_session_cb.pack(side='left', padx=5)
+        self.windowed_var = tk.BooleanVar(value=False)
+        self.windowed_cb = tk.Checkbutton(options_frame, text="Date windows", variable=self.windowed_var, **rb_style)
+        self.windowed_cb.pack(side='left', padx=5)
+        self.plan_var = tk.BooleanVar(value=False)
+        self.plan_cb = tk.Checkbutton(options_frame, text="Plan only", variable=self.plan_var, **rb_style)
+        self.plan_cb.pack(side='left', padx=5)
         # submit button
         self.submit_button = tk.Button(content_frame, text="Start Deletion", command=self.start_deletion_process, font=FONT_CONTROLS, bg=BTN_COLOR, fg="white", relief='flat', borderwidth=0, activebackground=BTN_HOVER_COLOR, activeforeground="white")
         self.submit_button.grid(row=6, column=0, columnspan=2, pady=30, ipadx=10, ipady=5, sticky='ew')
@@ -186,10 +459,49 @@ class DetweeterApp:
             self.num_entry.config(state='disabled')
         else:
             self.num_entry.config(state='normal')
+    def launch_settings(self): # the options that decide how the browser is launched, see driver_launch_key
+        return {
+            'browser': self.browser_choice.get(),
+            'headless': self.headless_var.get(),
+            'confirm_engine': 'network' if self.network_confirm_var.get() else 'dom'
+        }
+    def start_warmup(self): # (re)launches the background browser whenever a launch option changes
+        if self.thread and self.thread.is_alive():
+            return
+        if self.warmup:
+            if self.warmup.key == driver_launch_key(self.launch_settings()):
+                return
+            self.warmup.discard()
+        self.warmup = DriverWarmup(self.launch_settings())
+    def toggle_archive_state(self):
+        if self.archive_var.get():
+            self.archive_entry.config(state='readonly')
+            self.archive_button.config(state='normal')
+        else:
+            self.archive_entry.config(state='disabled')
+            self.archive_button.config(state='disabled')
+    def choose_archive(self):
+        path = filedialog.askopenfilename(title="Select tweets.js from your X archive, or a plan", filetypes=[("X archive tweets", "tweets*.js"), ("Plan manifest", "*.csv"), ("All files", "*.*")])
+        if path:
+            self.archive_path_var.set(path)
+    def toggle_rules_state(self):
+        if self.rules_var.get():
+            self.rules_entry.config(state='readonly')
+            self.rules_button.config(state='normal')
+        else:
+            self.rules_entry.config(state='disabled')
+            self.rules_button.config(state='disabled')
+    def choose_rules(self):
+        path = filedialog.askopenfilename(title="Select a rules file", filetypes=[("JSON", "*.json"), ("All files", "*.*")])
+        if path:
+            self.rules_path_var.set(path)
     def start_deletion_process(self):
         handle = self.handle_entry.get().strip().lstrip('@')
         password = self.password_entry.get()
-        if not handle or not password:
+        if not handle:
+            messagebox.showerror("Error", "Handle is required.")
+            return
+        if not password and not (self.reuse_session_var.get() and os.path.exists(session_path_for(handle))): # saved session makes the password optional
             messagebox.showerror("Error", "Handle and Password are required.")
             return
         num_to_delete = -1 # sentinel value
@@ -208,11 +520,40 @@ class DetweeterApp:
             except ValueError:
                 messagebox.showerror("Error", "Number to delete must be a valid integer.")
                 return
+        sessions_str = self.sessions_entry.get()
+        sessions = int(sessions_str) if sessions_str else 1
+        if sessions <= 0:
+            messagebox.showerror("Error", "Number of browser sessions must be at least 1.")
+            return
+        archive_path = None
+        if self.archive_var.get():
+            archive_path = self.archive_path_var.get()
+            if not archive_path or not os.path.isfile(archive_path):
+                messagebox.showerror("Error", "Please select the tweets.js file from your X archive.")
+                return
+            if self.plan_var.get():
+                messagebox.showerror("Error", "A plan walks your profile, untick From archive (an archive or plan already lists what to delete).")
+                return
+        rules = None
+        if self.rules_var.get():
+            try:
+                rules = load_rules(self.rules_path_var.get())
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Error", f"Could not use rules file: {e}")
+                return
         settings = {
             'handle': handle,
             'password': password,
             'num_to_delete': num_to_delete,
-            'browser': self.browser_choice.get()
+            'browser': self.browser_choice.get(),
+            'archive_path': archive_path,
+            'sessions': sessions,
+            'confirm_engine': 'network' if self.network_confirm_var.get() else 'dom',
+            'headless': self.headless_var.get(),
+            'reuse_session': self.reuse_session_var.get(),
+            'traversal': 'search' if self.windowed_var.get() else 'profile',
+            'rules': rules,
+            'plan': self.plan_var.get()
         }
         self.toggle_widgets_state('disabled') # disable GUI elements to prevent changes during operation
         self.log_widget.config(state='normal') # clear log widget
@@ -220,38 +561,59 @@ class DetweeterApp:
         self.log_widget.config(state='disabled')
         self.thread = threading.Thread( # start the worker thread
             target=run_detweeter_logic,
-            args=(settings, self.log_queue)
+            args=(settings, self.log_queue, self.warmup)
         )
+        self.warmup = None # handed over to the worker
         self.thread.daemon = True
         self.thread.start()
         self.poll_thread()
     def poll_thread(self): # check log queue and thread status
-        while True: # drain log queue
-            try:
-                message = self.log_queue.get_nowait()
-                self.display_log_message(message)
-            except queue.Empty:
-                break
-        if self.thread.is_alive(): # check if thread has finished
+        alive = self.thread.is_alive() # read before draining so nothing logged just before exit is missed
+        self.drain_log_queue()
+        if alive: # check if thread has finished
             self.root.after(100, self.poll_thread) # if not, schedule another check
         else: # if it has, run completion logic
             self.process_finished()
-    def display_log_message(self, message): # appends a message to log widget and scrolls to end
+    def drain_log_queue(self): # everything queued since the last tick becomes one batch
+        messages = []
+        while True:
+            try:
+                messages.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            batch = ''.join(messages)
+            self.file_log.info(batch)
+            self.display_log_message(batch)
+    def display_log_message(self, message): # appends a batch to log widget, trims it to MAX_LOG_LINES and scrolls to end
+        lines = message.splitlines(keepends=True)
+        if len(lines) > MAX_LOG_LINES: # no point inserting what the trim below would remove again
+            message = ''.join(lines[-MAX_LOG_LINES:])
         self.log_widget.config(state='normal')
         self.log_widget.insert(tk.END, message)
+        line_count = int(self.log_widget.index('end-1c').split('.')[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_widget.delete('1.0', f"{line_count - MAX_LOG_LINES + 1}.0")
         self.log_widget.see(tk.END)
         self.log_widget.config(state='disabled')
     def process_finished(self): # called when worker thread is complete
         self.toggle_widgets_state('normal')
         self.toggle_num_entry_state() # ensure num_entry state is correct based on checkbox
+        self.toggle_archive_state()
+        self.toggle_rules_state()
+        self.start_warmup() # next run gets a warm browser too
     def toggle_widgets_state(self, state):
-        for widget in [self.handle_entry, self.password_entry, self.num_entry, self.submit_button, self.firefox_rb, self.chrome_rb, self.delete_all_cb]:
+        for widget in [self.handle_entry, self.password_entry, self.num_entry, self.submit_button, self.firefox_rb, self.chrome_rb, self.sessions_entry, self.delete_all_cb, self.archive_cb, self.archive_entry, self.archive_button, self.rules_cb, self.rules_entry, self.rules_button, self.network_confirm_cb, self.headless_cb, self.reuse_session_cb, self.windowed_cb, self.plan_cb]:
             widget.config(state=state)
 
-def login_to_twitter(driver, wait, login_identifier, password):
+def login_to_twitter(driver, wait, login_identifier, password, pacer=None, base_url=BASE_URL):
+    with metrics.phase('login'):
+        return _login_to_twitter(driver, wait, login_identifier, password, pacer or Pacer(), base_url)
+
+def _login_to_twitter(driver, wait, login_identifier, password, pacer, base_url):
     browser_name = driver.capabilities.get('browserName', 'unknown')
     print(f"Navigating to login...")
-    driver.get("https://x.com/login")
+    driver.get(f"{base_url}/login")
     try:
         print("Entering username...")
         username_field = wait.until(EC.element_to_be_clickable(LOCATORS["LOGIN_IDENTIFIER_INPUT"]))
@@ -273,14 +635,18 @@ def login_to_twitter(driver, wait, login_identifier, password):
         print(f"Fatal error occurred during login input sequence: {e}")
         return False
     print("Checking page elements to verify login...")
-    max_attempts = 5  # *(1+1) = 10 second timeout
+    max_attempts = 5  # *(1+1) = 10 second timeout at the default pace
     for attempt in range(max_attempts):
-        time.sleep(1)  # pause initially
+        pacer.pause('login_check')  # pause initially
         print(f"  Login check attempt {attempt + 1}/{max_attempts}...")
-        if check_login_success(driver, browser_name): # robust multi-element check
+        started = time.monotonic() # only the check itself, our own pauses are not server latency
+        with metrics.phase('login_check'):
+            logged_in = check_login_success(driver, browser_name)
+        if logged_in: # robust multi-element check
             print("✓ Login successful!")
+            pacer.observe(time.monotonic() - started)
             return True
-        time.sleep(1)  # pause before retrying
+        pacer.pause('login_check')  # pause before retrying
     return False
 
 def check_login_success(driver, browser_name): # checks for multiple indicators of a successful login
@@ -305,142 +671,1417 @@ def check_login_success(driver, browser_name): # checks for multiple indicators
             continue
     return False
 
-def process_tweet(tweet, settings, wait, driver): # processes a single tweet and returns a status string: 'DELETED'/'SKIPPED_BOOKMARK'/'SKIPPED_AUTHOR'/'ERROR'
+class Pacer: # measures server latency and scales the delays between actions to it, backing off exponentially on rate-limit signals
+    def __init__(self, bounds=None):
+        self.bounds = dict(PACING_BOUNDS, **(bounds or {}))
+        self.latency = None # exponentially weighted moving average, seconds
+        self.consecutive_timeouts = 0
+        self.strikes = 0 # consecutive rate-limit signals, drives the backoff exponent
+        self.backoff_until = 0.0
+        self.recent_deletions = collections.deque(maxlen=20) # monotonic timestamps for the deletions/min estimate
+        self.lock = threading.Lock() # one pacer is shared by every session of an account
+    def delay(self, kind):
+        low, default, high = self.bounds[kind]
+        with self.lock:
+            if self.latency is None:
+                return default
+            return min(high, max(low, default * self.latency / REFERENCE_LATENCY))
+    def pause(self, kind):
+        with self.lock:
+            backoff = max(0.0, self.backoff_until - time.monotonic())
+        with metrics.phase(f"sleep:{kind}"): # our own waits, reported next to browser and server time
+            time.sleep(self.delay(kind) + backoff)
+    def wait_backoff(self): # only the rate-limit backoff, for read-only passes that skip the pacing pauses
+        with self.lock:
+            backoff = max(0.0, self.backoff_until - time.monotonic())
+        if backoff:
+            with metrics.phase("sleep:backoff"):
+                time.sleep(backoff)
+    def observe(self, latency): # feeds a measured response time into the moving average
+        with self.lock:
+            self.consecutive_timeouts = 0 # the server answered, so earlier timeouts were not in a row
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+    def success(self):
+        with self.lock:
+            self.consecutive_timeouts = 0
+            self.strikes = 0
+            self.recent_deletions.append(time.monotonic())
+            report = len(self.recent_deletions) % 10 == 0
+        if report:
+            print(self.describe())
+    def failure(self, error, driver): # inspects a failed action for throttling signals
+        signal = None
+        with self.lock:
+            if isinstance(error, TimeoutException):
+                self.consecutive_timeouts += 1
+                if self.consecutive_timeouts >= TIMEOUTS_BEFORE_BACKOFF:
+                    signal = f"{self.consecutive_timeouts} timeouts in a row"
+        if not signal:
+            signal = detect_rate_limit(driver)
+        if signal:
+            self.rate_limited(signal)
+        return signal
+    def rate_limited(self, reason): # exponential backoff with jitter, applied by every following pause()
+        with self.lock:
+            self.strikes += 1
+            self.consecutive_timeouts = 0
+            backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.strikes - 1))
+            backoff = backoff / 2 + random.uniform(0, backoff / 2)
+            self.backoff_until = max(self.backoff_until, time.monotonic() + backoff)
+        print(f"RATE LIMIT SUSPECTED ({reason}) — backing off {backoff:.0f}s (strike {self.strikes}).")
+        print(self.describe())
+    def describe(self):
+        with self.lock:
+            deletions = list(self.recent_deletions)
+            latency = self.latency
+            backoff = max(0.0, self.backoff_until - time.monotonic())
+        rate = 0.0
+        if len(deletions) > 1 and deletions[-1] > deletions[0]:
+            rate = 60 * (len(deletions) - 1) / (deletions[-1] - deletions[0])
+        latency_text = f"{latency:.2f}s" if latency is not None else "unmeasured"
+        backoff_text = f"{backoff:.0f}s left (strike {self.strikes})" if backoff else "none"
+        return f"Pace: {rate:.1f} deletions/min, latency {latency_text}, settle {self.delay('settle'):.2f}s, backoff {backoff_text}"
+
+class DeleteRequestWatcher: # confirms deletions from the DeleteTweet response in Chrome's DevTools network events instead of polling the DOM
+    def __init__(self, driver):
+        self.driver = driver
+        driver.execute_cdp_cmd("Network.enable", {})
+        self.drain()
+    def drain(self): # discards buffered events so the next wait only sees the request we are about to trigger
+        self.driver.get_log('performance')
+    def wait_for_delete(self, timeout=10): # returns (succeeded, detail, server latency in seconds), or None if no response arrived in time
+        deadline = time.monotonic() + timeout
+        request_id = None
+        sent_at = None
+        response = None
+        while time.monotonic() < deadline:
+            for record in self.driver.get_log('performance'):
+                message = json.loads(record['message'])['message']
+                method = message.get('method')
+                params = message.get('params', {})
+                if method == "Network.requestWillBeSent" and request_id is None:
+                    request = params.get('request', {})
+                    if DELETE_TWEET_ENDPOINT in request.get('url', '') and request.get('method') == 'POST':
+                        request_id = params['requestId']
+                        sent_at = params['timestamp']
+                elif request_id is None or params.get('requestId') != request_id:
+                    continue
+                elif method == "Network.responseReceived":
+                    response = params['response']['status']
+                elif method == "Network.loadingFailed":
+                    return False, params.get('errorText', 'request failed'), params['timestamp'] - sent_at
+                elif method == "Network.loadingFinished" and response is not None:
+                    return self.read_result(request_id, response) + (params['timestamp'] - sent_at,)
+            time.sleep(0.05)
+        return None
+    def read_result(self, request_id, http_status): # a 200 can still carry GraphQL errors (e.g. rate limits), so the body decides
+        if http_status != 200:
+            return False, f"HTTP {http_status}"
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {'requestId': request_id})
+            errors = json.loads(body.get('body') or '{}').get('errors')
+        except Exception: # body already evicted from the buffer, trust the status code
+            return True, "HTTP 200"
+        if errors:
+            return False, "; ".join(str(error.get('message', error)) for error in errors)
+        return True, "HTTP 200"
+
+def create_delete_watcher(driver, settings): # network confirm engine when requested and supported, otherwise None (DOM staleness confirmation)
+    if settings.get('confirm_engine') != 'network':
+        return None
+    if settings['browser'] != "Chrome":
+        print("Network confirmation needs Chrome DevTools, falling back to DOM confirmation.")
+        return None
     try:
-        author_handle = tweet.find_element(*LOCATORS["TWEET_AUTHOR_HANDLE"]).text[1:]
-        if author_handle.lower() != settings['handle'].lower():
+        return DeleteRequestWatcher(driver)
+    except Exception as e:
+        print(f"Network confirmation unavailable ({type(e).__name__}), falling back to DOM confirmation.")
+        return None
+
+def detect_rate_limit(driver): # returns the matched error text if X is showing a throttling/error message, else None
+    try:
+        return driver.execute_script(RATE_LIMIT_SCRIPT)
+    except Exception:
+        return None
+
+def compile_rules(rules): # builds the JS predicate for SNAPSHOT_SCRIPT: returns the name of the rule keeping a tweet, or null for a deletion candidate
+    unknown = set(rules) - set(RULE_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(sorted(unknown))}")
+    constants = [] # evaluated once per snapshot, not per tweet
+    checks = [] # only rules that are set produce a check
+    if rules.get('keep_ids'):
+        constants.append(f"var keepIds = {json.dumps({str(status_id): 1 for status_id in rules['keep_ids']})};")
+        checks.append("if (keepIds.hasOwnProperty(tweet.status_id)) return 'keep_ids';")
+    for key, op in (('after', '<'), ('before', '>=')): # after is inclusive, before exclusive, both UTC days
+        if rules.get(key):
+            try:
+                day = datetime.date.fromisoformat(str(rules[key]))
+            except ValueError:
+                raise ValueError(f"Rule '{key}' must be a YYYY-MM-DD date.")
+            bound = int(datetime.datetime.combine(day, datetime.time(), datetime.timezone.utc).timestamp() * 1000)
+            checks.append(f"if (!tweet.created_at || Date.parse(tweet.created_at) {op} {bound}) return '{key}';")
+    for metric, testids in (('likes', ['like', 'unlike']), ('retweets', ['retweet', 'unretweet'])):
+        bounds = [(key, op) for key, op in ((f"min_{metric}", '<'), (f"max_{metric}", '>')) if rules.get(key) is not None]
+        if bounds:
+            checks.append(f"var {metric} = count(article, {json.dumps(testids)});")
+        for key, op in bounds:
+            if not isinstance(rules[key], int) or rules[key] < 0:
+                raise ValueError(f"Rule '{key}' must be a whole number.")
+            checks.append(f"if ({metric} {op} {rules[key]}) return '{key}';")
+    if rules.get('text_pattern'):
+        try: # JS and Python share the common regex syntax, catch typos before the browser does
+            re.compile(rules['text_pattern'])
+        except re.error as e:
+            raise ValueError(f"Rule 'text_pattern' is not a valid pattern: {e}")
+        for match in JS_INCOMPATIBLE_REGEX.finditer(rules['text_pattern']): # valid in Python only would fail every snapshot mid-run
+            token = match.group()
+            if token[0] == '[' or (token[0] == '\\' and token[1] not in 'AZ'):
+                continue
+            raise ValueError(f"Rule 'text_pattern' uses syntax the browser does not support: {token}")
+        constants.append(f"var pattern = new RegExp({json.dumps(rules['text_pattern'])}, 'i');")
+        checks.append("if (!pattern.test(text(article))) return 'text_pattern';")
+    if rules.get('media') is not None: # true: only tweets with photos/video, false: only tweets without
+        checks.append(f"if (hasMedia(article) !== {json.dumps(bool(rules['media']))}) return 'media';")
+    if rules.get('kind'):
+        if rules['kind'] not in ('reply', 'original'):
+            raise ValueError("Rule 'kind' must be 'reply' or 'original'.")
+        checks.append(f"if (isReply(article) !== {json.dumps(rules['kind'] == 'reply')}) return 'kind';")
+    return "(function () {\n%s\nreturn function (article, tweet) {\n%s\nreturn null;\n};\n})()" % ("\n".join(constants), "\n".join(checks))
+
+def load_rules(path): # reads a rules file, a JSON object keyed by RULE_KEYS, and checks it compiles
+    with open(path, encoding='utf-8') as f:
+        rules = json.load(f)
+    if not isinstance(rules, dict):
+        raise ValueError("Rules file must contain a JSON object.")
+    compile_rules(rules)
+    return rules
+
+def snapshot_script(settings): # SNAPSHOT_SCRIPT with the run's rules compiled in, built once per rule set
+    rules = settings.get('rules') or {}
+    key = json.dumps(rules, sort_keys=True)
+    script = compiled_snapshot_scripts.get(key)
+    if script is None:
+        script = compiled_snapshot_scripts[key] = SNAPSHOT_SCRIPT.replace("/* RULES */", compile_rules(rules))
+    return script
+
+def rules_fingerprint(settings): # identifies the rule set a date window was finished under, '' without rules
+    rules = settings.get('rules') or {}
+    return hashlib.sha1(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest() if rules else ''
+
+def describe_rules(rules): # one line for the log, e.g. "after=2020-01-01, max_likes=5"
+    return ", ".join(f"{key}={len(rules[key]) if key == 'keep_ids' else rules[key]}" for key in RULE_KEYS if rules.get(key) not in (None, "", []))
+
+def snapshot_timeline(driver, settings): # returns [{permalink, status_id, author, bookmarked, created_at, rule, element}] for all visible tweets in one WebDriver call
+    with metrics.phase('snapshot'):
+        return driver.execute_script(snapshot_script(settings), settings['handle']) or []
+
+def classify_tweet(entry, settings): # selection rules evaluated on a snapshot entry in Python, returns a skip status or None if tweet qualifies
+    with metrics.phase('author_check'):
+        if (entry['author'] or '').lower() != settings['handle'].lower():
             return 'SKIPPED_AUTHOR'
-        if tweet.find_elements(*LOCATORS["BOOKMARK_BUTTON_EXISTS"]):
-            permalink = tweet.find_element(*LOCATORS["TWEET_PERMALINK"]).get_attribute('href')
-            print(f"Skipped (bookmarked): {permalink}")
+    with metrics.phase('bookmark_check'):
+        if entry['bookmarked']:
             return 'SKIPPED_BOOKMARK'
-        permalink = tweet.find_element(*LOCATORS["TWEET_PERMALINK"]).get_attribute('href')
-        print(f"QUALIFIES FOR DELETION: {permalink}")
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tweet)
-        time.sleep(0.5)
-        more_options_button = tweet.find_element(*LOCATORS["MORE_OPTIONS_BUTTON"])
-        driver.execute_script("arguments[0].click();", more_options_button)
-        delete_item = wait.until(EC.element_to_be_clickable(LOCATORS["DELETE_MENU_ITEM"]))
-        driver.execute_script("arguments[0].click();", delete_item)
-        confirm_button = wait.until(EC.element_to_be_clickable(LOCATORS["DELETE_CONFIRM_BUTTON"]))
-        driver.execute_script("arguments[0].click();", confirm_button)
-        wait.until(EC.staleness_of(tweet))
+    if entry.get('rule'): # already decided in the page by the compiled rules
+        return 'SKIPPED_RULE'
+    return None
+
+def process_tweet(entry, settings, wait, driver, pacer, watcher=None): # processes a single snapshot entry and returns a status string: 'DELETED'/'SKIPPED_BOOKMARK'/'SKIPPED_RULE'/'SKIPPED_AUTHOR'/'ERROR'
+    status = classify_tweet(entry, settings)
+    if status == 'SKIPPED_BOOKMARK':
+        print(f"Skipped (bookmarked): {entry['permalink']}")
+    elif status == 'SKIPPED_RULE':
+        print(f"Kept (rule: {entry['rule']}): {entry['permalink']}")
+    if status:
+        return status
+    tweet = entry['element']
+    try:
+        print(f"QUALIFIES FOR DELETION: {entry['permalink']}")
+        with metrics.phase('scroll_into_view'):
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tweet)
+        pacer.pause('settle')
+        with metrics.phase('menu_open'):
+            more_options_button = tweet.find_element(*LOCATORS["MORE_OPTIONS_BUTTON"])
+            driver.execute_script("arguments[0].click();", more_options_button)
+        with metrics.phase('delete_menu_wait'):
+            delete_item = wait.until(EC.element_to_be_clickable(LOCATORS["DELETE_MENU_ITEM"]))
+            driver.execute_script("arguments[0].click();", delete_item)
+        with metrics.phase('confirm'):
+            confirm_button = wait.until(EC.element_to_be_clickable(LOCATORS["DELETE_CONFIRM_BUTTON"]))
+            if watcher:
+                watcher.drain()
+            driver.execute_script("arguments[0].click();", confirm_button)
+        if watcher: # server reply decides, no staleness wait on the critical path
+            with metrics.phase('network_confirm'):
+                result = watcher.wait_for_delete()
+            if result is None:
+                raise TimeoutException("No DeleteTweet response from the server.")
+            succeeded, detail, latency = result
+            pacer.observe(latency)
+            if not succeeded:
+                print(f"  - Server rejected deletion: {detail}")
+                if 'limit' in detail.lower() or '429' in detail:
+                    pacer.rate_limited(detail)
+                return 'ERROR'
+            pacer.success()
+            return 'DELETED'
+        confirmed = time.monotonic()
+        with metrics.phase('staleness_wait'):
+            wait.until(EC.staleness_of(tweet))
+        pacer.observe(time.monotonic() - confirmed) # delete request round trip + re-render
+        pacer.success()
+        pacer.pause('delete') # small pause for UI to settle
         return 'DELETED'
     except (TimeoutException, StaleElementReferenceException, NoSuchElementException) as e:
         print(f"  - Action failed: {type(e).__name__}. Closing menu and continuing.")
         try:
             driver.find_element(*LOCATORS["BODY"]).send_keys(Keys.ESCAPE)
-            time.sleep(0.5)
+            pacer.pause('escape')
         except: pass
+        pacer.failure(e, driver)
+        return 'ERROR'
+
+def iter_archive_status_ids(archive_path, chunk_size=1 << 16): # streams status ids out of an X archive's data/tweets.js one entry at a time
+    decoder = json.JSONDecoder()
+    with open(archive_path, encoding='utf-8') as archive:
+        buffer = ""
+        while '[' not in buffer: # skip the "window.YTD.tweets.part0 = " assignment in front of the array
+            chunk = archive.read(chunk_size)
+            if not chunk:
+                return
+            buffer += chunk
+        buffer = buffer[buffer.index('[') + 1:]
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError: # entry cut off at the chunk boundary, read more and try again
+                chunk = archive.read(chunk_size)
+                if not chunk:
+                    if buffer:
+                        raise ValueError(f"Archive file appears to be truncated: {archive_path}")
+                    return
+                buffer += chunk
+                continue
+            buffer = buffer[end:]
+            tweet = item.get('tweet', item) # newer archives wrap each entry as {"tweet": {...}}
+            status_id = tweet.get('id_str') or tweet.get('id')
+            if status_id:
+                yield str(status_id)
+
+def iter_manifest_status_ids(manifest_path): # status ids a plan marked DELETE, in walk order; edit a row's decision to keep that tweet
+    with open(manifest_path, newline='', encoding='utf-8') as manifest:
+        for row in csv.DictReader(manifest):
+            if row.get('decision') == 'DELETE' and row.get('status_id'):
+                yield row['status_id']
+
+def is_manifest(path):
+    return path.lower().endswith('.csv')
+
+def iter_status_ids(path): # work list for archive mode: an X archive's tweets.js or a plan manifest
+    return iter_manifest_status_ids(path) if is_manifest(path) else iter_archive_status_ids(path)
+
+class ProgressJournal: # crash-safe on-disk record of each tweet's outcome, loaded as an in-memory index so resumed runs skip known tweets
+    FINAL_STATUSES = ('DELETED', 'MISSING') # failures are retried on resume, and kept tweets re-evaluated: un-bookmarking or a changed rule set makes them deletable
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock() # shared by pooled sessions
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL") # each commit is an append to the write-ahead log, survives crashes mid-run
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS outcomes (status_id TEXT PRIMARY KEY, permalink TEXT, status TEXT NOT NULL, updated REAL NOT NULL)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS windows (since TEXT NOT NULL, until TEXT NOT NULL, finished REAL NOT NULL, rules TEXT NOT NULL DEFAULT '', PRIMARY KEY (since, until))")
+        if 'rules' not in [column[1] for column in self.connection.execute("PRAGMA table_info(windows)")]: # journals written before windows were tied to a rule set
+            self.connection.execute("ALTER TABLE windows ADD COLUMN rules TEXT NOT NULL DEFAULT ''")
+        self.connection.commit()
+        self.index = dict(self.connection.execute("SELECT status_id, status FROM outcomes"))
+        self.finished_windows = dict(((since, until), rules) for since, until, rules in self.connection.execute("SELECT since, until, rules FROM windows"))
+    def is_done(self, status_id):
+        return self.index.get(status_id) in self.FINAL_STATUSES
+    def done_count(self):
+        return sum(1 for status in self.index.values() if status in self.FINAL_STATUSES)
+    def record(self, status_id, permalink, status):
+        if not status_id:
+            return
+        with self.lock:
+            self.index[status_id] = status
+            self.connection.execute("INSERT OR REPLACE INTO outcomes (status_id, permalink, status, updated) VALUES (?, ?, ?, ?)", (status_id, permalink, status, time.time()))
+            self.connection.commit()
+    def window_done(self, since, until, rules): # finished under the same rule set, a changed one re-opens the window
+        return self.finished_windows.get((since, until)) == rules
+    def mark_window_done(self, since, until, rules):
+        with self.lock:
+            self.finished_windows[(since, until)] = rules
+            self.connection.execute("INSERT OR REPLACE INTO windows (since, until, finished, rules) VALUES (?, ?, ?, ?)", (since, until, time.time(), rules))
+            self.connection.commit()
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class RetryQueue: # failed deletions waiting for another attempt, with exponential backoff and an attempt limit
+    def __init__(self):
+        self.pending = [] # heap of (due time, status_id, permalink, attempts so far)
+        self.failed = [] # permalinks that used up every attempt
+        self.lock = threading.Lock() # shared by pooled sessions
+    def __len__(self):
+        with self.lock:
+            return len(self.pending)
+    def add(self, status_id, permalink, attempts=1):
+        if not status_id:
+            return
+        with self.lock:
+            if attempts >= RETRY_MAX_ATTEMPTS:
+                self.failed.append(permalink)
+                print(f"  - Giving up after {attempts} attempts: {permalink}")
+                return
+            delay = RETRY_BASE_DELAY * 2 ** (attempts - 1)
+            heapq.heappush(self.pending, (time.monotonic() + delay, status_id, permalink, attempts))
+        print(f"  - Queued for retry in {delay:.0f}s (attempt {attempts + 1}/{RETRY_MAX_ATTEMPTS}): {permalink}")
+    def pop_due(self, wait=False): # items whose backoff has passed; with wait=True sleeps until the next one is due (end of run)
+        with self.lock:
+            if wait and self.pending:
+                delay = self.pending[0][0] - time.monotonic()
+            else:
+                delay = 0
+        if delay > 0:
+            print(f"Waiting {delay:.0f}s for the next retry...")
+            time.sleep(delay)
+        due = []
+        with self.lock:
+            while self.pending and self.pending[0][0] <= time.monotonic():
+                due.append(heapq.heappop(self.pending))
+        return due
+    def unresolved(self): # permalinks that never succeeded: out of attempts, or still waiting when the run ended
+        with self.lock:
+            return self.failed + [permalink for _, _, permalink, _ in sorted(self.pending)]
+
+class DeletionManifest: # plan mode output, one CSV row per own tweet with the decision a real run would make
+    FIELDS = ('status_id', 'permalink', 'author', 'bookmarked', 'created_at', 'decision', 'rule')
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.FIELDS)
+    def add(self, entry, status): # status from classify_tweet, 'PLANNED' for a deletion candidate
+        decision = 'DELETE' if status == 'PLANNED' else status
+        self.writer.writerow([entry['status_id'], entry['permalink'], entry['author'], entry['bookmarked'], entry['created_at'] or '', decision, entry.get('rule') or ''])
+    def flush(self):
+        self.file.flush()
+    def close(self):
+        self.file.close()
+
+def journal_path_for(handle):
+    return os.path.join(DATA_DIR, f"{handle.lower()}.journal.sqlite")
+
+def status_permalink(settings, status_id):
+    return f"{settings.get('base_url', BASE_URL)}/{settings['handle']}/status/{status_id}"
+
+def target_reached(settings, stats):
+    return settings["num_to_delete"] > 0 and stats['deleted'] >= settings["num_to_delete"]
+
+def record_status(status, stats): # tallies a process_tweet outcome into the session counters
+    if status == 'DELETED':
+        stats['processed'] += 1
+        stats['deleted'] += 1
+        print(f"TWEET DELETED — TOTAL THIS SESSION: {stats['deleted']}")
+    elif status in ('SKIPPED_BOOKMARK', 'SKIPPED_RULE'):
+        stats['processed'] += 1
+        stats['skipped'] += 1
+    elif status == 'ERROR':
+        # An attempt was made on our tweet, but failed, so it's counted as processed
+        stats['processed'] += 1
+        stats['errors'] += 1
+    elif status == 'MISSING':
+        stats['missing'] += 1
+    elif status == 'RESUMED':
+        stats['resumed'] += 1
+    elif status == 'PLANNED': # plan mode: would be deleted
+        stats['processed'] += 1
+        stats['planned'] += 1
+    # if status is 'SKIPPED_AUTHOR', we do nothing and don't count it
+
+def handle_outcome(status, status_id, permalink, stats, journal, retries, attempts=0): # journals an outcome, tallies it and queues failures for retry
+    if status == 'SKIPPED_AUTHOR' and not attempts: # someone else's tweet: nothing to resume, not worth a journal write
+        return
+    journal.record(status_id, permalink, status)
+    if attempts: # a retry: the first failure was already counted as evaluated and failed, possibly by another session's stats
+        stats['retried'] += 1
+        if status == 'ERROR':
+            retries.add(status_id, permalink, attempts + 1)
+            return
+        stats['recovered'] += 1 # offsets that failure in the totals, the counters themselves never go down
+        record_status(status, stats)
+        if status != 'MISSING':
+            stats['processed'] -= 1 # undoes record_status' increment, not the original one
+        return
+    record_status(status, stats)
+    if status == 'ERROR':
+        retries.add(status_id, permalink, attempts + 1)
+
+def drain_retries(driver, wait, settings, stats, journal, retries, pacer, watcher=None, in_new_tab=False, final=False): # retries due failures between fresh scans; final=True keeps going until the queue is empty
+    while not target_reached(settings, stats):
+        due = retries.pop_due(wait=final)
+        if not due:
+            if final and len(retries):
+                continue
+            return
+        original_window = driver.current_window_handle if in_new_tab else None
+        if in_new_tab: # a separate tab keeps the timeline's scroll position
+            driver.switch_to.new_window('tab')
+        try:
+            for index, (_, status_id, permalink, attempts) in enumerate(due):
+                if target_reached(settings, stats): # put the rest back untouched
+                    for item in due[index:]:
+                        retries.add(item[1], item[2], item[3])
+                    break
+                print(f"Retrying (attempt {attempts + 1}/{RETRY_MAX_ATTEMPTS}): {permalink}")
+                status = delete_status(driver, wait, settings, status_id, pacer, watcher)
+                handle_outcome(status, status_id, permalink, stats, journal, retries, attempts)
+        finally:
+            if in_new_tab:
+                driver.close()
+                driver.switch_to.window(original_window)
+        if not final:
+            return
+
+def scroll_timeline(driver, pacer, settle=True): # scrolls to the bottom and returns as soon as X serves more tweets, measuring how long that took
+    with metrics.phase('scroll_pass'):
+        return _scroll_timeline(driver, pacer, settle)
+
+def _scroll_timeline(driver, pacer, settle):
+    height = driver.execute_script("var height = document.body.scrollHeight; window.scrollTo(0, height); return height;")
+    if settle:
+        pacer.pause('settle') # also where any rate-limit backoff is served
+    else:
+        pacer.wait_backoff()
+    started = time.monotonic()
+    try:
+        WebDriverWait(driver, SCROLL_TIMEOUT, poll_frequency=0.25).until(lambda d: d.execute_script("return document.body.scrollHeight;") > height)
+    except TimeoutException: # nothing new within the timeout, the stall counter decides whether this is the end
+        return False
+    pacer.observe(time.monotonic() - started)
+    return True
+
+def open_profile(driver, settings): # /with_replies so replies are included, returns once the profile has rendered
+    profile_url = f"{settings.get('base_url', BASE_URL)}/{settings['handle']}/with_replies"
+    print(f"Navigating to user profile...")
+    driver.get(profile_url)
+    long_wait = WebDriverWait(driver, 20)
+    long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"a[href='/{settings['handle']}']")))
+
+def delete_from_timeline(driver, wait, settings, stats, journal, retries, pacer, watcher=None): # infinite-scrolls /with_replies, deleting qualifying tweets as they render
+    open_profile(driver, settings)
+    print("DETWEETION COMMENCING...")
+    time.sleep(2)
+    if settings["num_to_delete"] == 0:
+        print("∞ MODE — ALL unbookmarked tweets.")
+    else:
+        print(f"# MODE — {settings['num_to_delete']} most recent unbookmarked tweets.")
+    walk_page(driver, wait, settings, stats, journal, retries, pacer, watcher)
+
+def walk_page(driver, wait, settings, stats, journal, retries, pacer, watcher=None, max_stalls=3, walked=None): # processes the loaded timeline/search page, scrolling until it stops growing; False if the target cut it short. walked collects the ids handled
+    processed_permalinks = set()
+    stalls = 0
+    while True:
+        if target_reached(settings, stats):
+            print(f"Target ({settings['num_to_delete']}) deletions reached.")
+            return False
+        tweets_on_page = snapshot_timeline(driver, settings) # filtering and dedupe below happen in Python, only qualifying tweets touch the browser again
+        if not tweets_on_page and stalls == 0:
+            print("No tweets found on initial load. Scrolling down to find some.")
+        found_new_tweet_this_pass = False
+        for entry in tweets_on_page:
+            if target_reached(settings, stats):
+                break # check again in case inner loop reached target
+            permalink = entry['permalink']
+            if not permalink: # permalink not rendered yet (picked up on a later pass) or an ad
+                print("  - Could not process a tweet element, may have become stale or been an ad.")
+                continue
+            if permalink in processed_permalinks:
+                continue
+            found_new_tweet_this_pass = True
+            processed_permalinks.add(permalink)
+            if journal.is_done(entry['status_id']): # handled by an earlier run, no DOM work needed
+                record_status('RESUMED', stats)
+                continue
+            status = process_tweet(entry, settings, wait, driver, pacer, watcher)
+            handle_outcome(status, entry['status_id'], permalink, stats, journal, retries)
+            if walked is not None:
+                walked.add(entry['status_id'])
+        else: # runs if the for loop completes without a break
+            if found_new_tweet_this_pass:
+                stalls = 0
+                print("Visible tweets have been processed. Scrolling...")
+            else:
+                stalls += 1
+                if pacer.failure(None, driver) and pacer.strikes < 5: # an error placeholder instead of more tweets, wait out the backoff rather than counting a stall
+                    stalls = 0
+            if stalls >= max_stalls:
+                print("Scrolling appears to have reached the end of timeline.")
+                return True
+            drain_retries(driver, wait, settings, stats, journal, retries, pacer, watcher, in_new_tab=True)
+            scroll_timeline(driver, pacer)
+
+def iter_search_windows(settings): # (since, until) date pairs, newest first, covering SEARCH_EPOCH (or settings['search_since']) up to today
+    start = datetime.date.fromisoformat(settings.get('search_since') or SEARCH_EPOCH)
+    step = datetime.timedelta(days=settings.get('window_days') or SEARCH_WINDOW_DAYS)
+    end = datetime.date.today() + datetime.timedelta(days=1) # until: is exclusive
+    for index in reversed(range(-(-(end - start).days // step.days))): # boundaries anchored at the start date so they match across resumed runs
+        since = start + index * step
+        yield since.isoformat(), min(since + step, end).isoformat()
+
+def search_window_url(settings, since, until):
+    query = urllib.parse.quote(f"from:{settings['handle']} since:{since} until:{until}")
+    return f"{settings.get('base_url', BASE_URL)}/search?q={query}&src=typed_query&f=live"
+
+def load_search_window(driver, wait, settings, pacer, since, until): # opens one window's search page: True if it lists tweets, False if X shows the empty state, None if it never loaded
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        pacer.wait_backoff() # a throttled load must not be followed straight away by the next one
+        driver.get(search_window_url(settings, since, until))
+        try:
+            wait.until(EC.any_of(EC.presence_of_element_located(LOCATORS["TWEET_ARTICLE"]), EC.presence_of_element_located(LOCATORS["EMPTY_STATE"])))
+        except TimeoutException as e: # slow or throttled, either way nothing is known about the window yet
+            pacer.failure(e, driver)
+            continue
+        if driver.find_elements(*LOCATORS["TWEET_ARTICLE"]):
+            return True
+        if driver.find_elements(*LOCATORS["EMPTY_STATE"]):
+            return False
+    return None
+
+def process_search_window(driver, wait, settings, stats, journal, retries, pacer, watcher, since, until): # loads one window's search page fresh, so browser memory never carries over between windows
+    print(f"Window {since} → {until}...")
+    walked = set() # status ids handled during this walk, their latest journal outcome decides whether the window is finished
+    loaded = load_search_window(driver, wait, settings, pacer, since, until)
+    if loaded is None: # did not load after retries, leave the window unfinished so it is walked again
+        print(f"  - Window did not load, left for the next run: {since} → {until}")
+        return False
+    if loaded:
+        if not walk_page(driver, wait, settings, stats, journal, retries, pacer, watcher, SEARCH_WINDOW_STALLS, walked):
+            return False
+    if any(journal.index.get(status_id) == 'ERROR' for status_id in walked): # still failing, walked again on resume
+        return False
+    journal.mark_window_done(since, until, rules_fingerprint(settings)) # bookmarked and rule-kept tweets count as finished for this rule set
+    return True
+
+def delete_by_search_windows(driver, wait, settings, stats, journal, retries, pacer, watcher=None): # walks from:<handle> search results one date window at a time instead of one endless profile scroll
+    print("DETWEETION COMMENCING...")
+    if settings["num_to_delete"] == 0:
+        print(f"DATE WINDOW MODE — ALL unbookmarked tweets, {settings.get('window_days') or SEARCH_WINDOW_DAYS}-day windows.")
+    else:
+        print(f"DATE WINDOW MODE — {settings['num_to_delete']} most recent unbookmarked tweets.")
+    for since, until in iter_search_windows(settings):
+        if journal.window_done(since, until, rules_fingerprint(settings)):
+            continue
+        process_search_window(driver, wait, settings, stats, journal, retries, pacer, watcher, since, until)
+        if target_reached(settings, stats):
+            print(f"Target ({settings['num_to_delete']}) deletions reached.")
+            break
+    else:
+        print("All date windows walked.")
+
+def plan_target_reached(settings, stats):
+    return settings["num_to_delete"] > 0 and stats['planned'] >= settings["num_to_delete"]
+
+def plan_page(driver, settings, stats, manifest, pacer, max_stalls=3): # walk_page without any clicks or pacing pauses: every rendered tweet is classified into the manifest; False if the target cut it short
+    processed_permalinks = set()
+    stalls = 0
+    while True:
+        found_new_tweet_this_pass = False
+        for entry in snapshot_timeline(driver, settings):
+            permalink = entry['permalink']
+            if not permalink or permalink in processed_permalinks:
+                continue
+            found_new_tweet_this_pass = True
+            processed_permalinks.add(permalink)
+            status = classify_tweet(entry, settings) or 'PLANNED' # same selection as process_tweet
+            if status != 'SKIPPED_AUTHOR':
+                manifest.add(entry, status)
+            record_status(status, stats)
+            if plan_target_reached(settings, stats):
+                print(f"Target ({settings['num_to_delete']}) deletions planned.")
+                return False
+        manifest.flush()
+        if found_new_tweet_this_pass:
+            stalls = 0
+            print(f"Planned {stats['planned']} deletions, {stats['skipped']} kept so far. Scrolling...")
+        else:
+            stalls += 1
+            if pacer.failure(None, driver) and pacer.strikes < 5:
+                stalls = 0
+        if stalls >= max_stalls:
+            print("Scrolling appears to have reached the end of timeline.")
+            return True
+        scroll_timeline(driver, pacer, settle=False)
+
+def plan_search_windows(driver, wait, settings, stats, manifest, pacer):
+    for since, until in iter_search_windows(settings):
+        print(f"Window {since} → {until}...")
+        loaded = load_search_window(driver, wait, settings, pacer, since, until)
+        if loaded is None:
+            print(f"  - Window did not load, missing from the plan: {since} → {until}")
+            continue
+        if loaded and not plan_page(driver, settings, stats, manifest, pacer, SEARCH_WINDOW_STALLS):
+            return
+    print("All date windows walked.")
+
+def run_plan(driver, wait, settings, stats, pacer): # dry run: reads the timeline (or date windows) and writes a manifest a later run can take as its work list
+    path = settings.get('plan_path') or os.path.join(PLANS_DIR, f"{settings['handle'].lower()}-{time.strftime('%Y%m%d-%H%M%S')}.csv")
+    manifest = DeletionManifest(path)
+    print(f"PLAN MODE — nothing is deleted, candidates are written to {path}")
+    try:
+        if settings.get('traversal') == 'search':
+            plan_search_windows(driver, wait, settings, stats, manifest, pacer)
+        else:
+            open_profile(driver, settings)
+            plan_page(driver, settings, stats, manifest, pacer)
+    finally:
+        manifest.close()
+    print(f"Review the plan, then run again with it as the archive file to delete exactly those tweets: {path}")
+
+def delete_status(driver, wait, settings, status_id, pacer, watcher=None): # opens a single status page and runs process_tweet on it, 'MISSING' if it no longer exists
+    pacer.pause('settle') # serves any rate-limit backoff before the next page load
+    started = time.monotonic()
+    try:
+        with metrics.phase('status_page_load'):
+            driver.get(status_permalink(settings, status_id))
+            wait.until(EC.any_of(EC.presence_of_element_located(LOCATORS["TWEET_ARTICLE"]), EC.presence_of_element_located(LOCATORS["STATUS_NOT_FOUND"])))
+    except TimeoutException as e: # neither the tweet nor X's not-found page, a slow or throttled load — retried, never journalled as MISSING
+        pacer.failure(e, driver)
+        print(f"Status page did not load: {status_id}")
         return 'ERROR'
+    pacer.observe(time.monotonic() - started) # a not-found page is an answer too, it must not count towards the timeout backoff
+    if not driver.find_elements(*LOCATORS["TWEET_ARTICLE"]):
+        print(f"Not found (already deleted?): {status_id}")
+        return 'MISSING'
+    for entry in snapshot_timeline(driver, settings): # status page also renders parents and replies, pick the focal tweet
+        if entry['status_id'] == status_id:
+            return process_tweet(entry, settings, wait, driver, pacer, watcher)
+    print(f"Not found (already deleted?): {status_id}")
+    return 'MISSING'
+
+def delete_from_archive(driver, wait, settings, stats, journal, retries, pacer, watcher=None): # visits each status id from the archive directly, no timeline scrolling
+    print("DETWEETION COMMENCING...")
+    source = "MANIFEST" if is_manifest(settings['archive_path']) else "ARCHIVE"
+    if settings["num_to_delete"] == 0:
+        print(f"{source} MODE — ALL unbookmarked tweets in {os.path.basename(settings['archive_path'])}.")
+    else:
+        print(f"{source} MODE — first {settings['num_to_delete']} unbookmarked tweets in {os.path.basename(settings['archive_path'])}.")
+    for status_id in iter_status_ids(settings['archive_path']):
+        if target_reached(settings, stats):
+            print(f"Target ({settings['num_to_delete']}) deletions reached.")
+            break
+        if journal.is_done(status_id):
+            record_status('RESUMED', stats)
+            continue
+        status = delete_status(driver, wait, settings, status_id, pacer, watcher)
+        handle_outcome(status, status_id, status_permalink(settings, status_id), stats, journal, retries)
+        drain_retries(driver, wait, settings, stats, journal, retries, pacer, watcher)
+    else:
+        print("Reached the end of the archive.")
+
+class DeletionBudget: # shares the num_to_delete target across parallel sessions without overshooting it
+    def __init__(self, target):
+        self.target = target # 0 means unlimited
+        self.deleted = 0
+        self.in_flight = 0
+        self.condition = threading.Condition()
+    def exhausted(self):
+        with self.condition:
+            return self.target > 0 and self.deleted >= self.target
+    def acquire(self): # blocks while pending attempts could still fill the target, returns False once it is reached
+        with self.condition:
+            while self.target > 0 and self.deleted + self.in_flight >= self.target and self.deleted < self.target:
+                self.condition.wait()
+            if self.target > 0 and self.deleted >= self.target:
+                return False
+            self.in_flight += 1
+            return True
+    def release(self, status):
+        with self.condition:
+            self.in_flight -= 1
+            if status == 'DELETED':
+                self.deleted += 1
+            self.condition.notify_all()
+
+def new_stats():
+    return {'processed': 0, 'skipped': 0, 'deleted': 0, 'errors': 0, 'missing': 0, 'resumed': 0, 'retried': 0, 'recovered': 0, 'planned': 0}
+
+def load_driver_cache():
+    try:
+        with open(DRIVER_CACHE_PATH, encoding='utf-8') as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+def install_driver(browser): # the only step that needs network access, its result is cached for later runs
+    print(f"Fetching {browser} driver...")
+    if browser == "Firefox":
+        from webdriver_manager.firefox import GeckoDriverManager as DriverManager
+    else:
+        from webdriver_manager.chrome import ChromeDriverManager as DriverManager
+    driver_path = DriverManager().install()
+    cache = load_driver_cache()
+    cache[browser] = driver_path
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(DRIVER_CACHE_PATH, 'w', encoding='utf-8') as cache_file:
+        json.dump(cache, cache_file, indent=2)
+    return driver_path
+
+def resolve_driver_path(settings): # configured path first, then the cached one, webdriver_manager only when neither exists; returns (path, source)
+    if settings.get('driver_path'):
+        return settings['driver_path'], 'configured'
+    cached = load_driver_cache().get(settings['browser'])
+    if cached and os.path.isfile(cached):
+        return cached, 'cached'
+    return install_driver(settings['browser']), 'downloaded'
+
+def build_driver(settings): # creates a configured Firefox/Chrome driver, shared by the main session and every pooled session
+    driver_path, source = resolve_driver_path(settings)
+    try:
+        return launch_browser(settings, driver_path)
+    except SessionNotCreatedException:
+        if source != 'cached':
+            raise
+        print("Cached driver no longer matches the installed browser.") # browser auto-updated since the driver was cached
+        return launch_browser(settings, install_driver(settings['browser']))
+
+def load_webdriver_support(): # WebDriverWait and expected_conditions pull in Selenium's remote WebDriver stack, so they wait for the first launch
+    global WebDriverWait, EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+def browser_modules(browser): # (Service, Options, WebDriver) of the chosen browser only, the other browser's stack is never imported
+    if browser == "Firefox":
+        from selenium.webdriver.firefox.service import Service
+        from selenium.webdriver.firefox.options import Options
+        from selenium.webdriver.firefox.webdriver import WebDriver
+    else:
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.webdriver import WebDriver
+    return Service, Options, WebDriver
+
+def launch_browser(settings, driver_path):
+    load_webdriver_support()
+    Service, Options, WebDriver = browser_modules(settings['browser'])
+    service = Service(driver_path)
+    options = Options()
+    if settings['browser'] == "Firefox":
+        options.set_preference("layout.css.devPixelsPerPx", "0.8")
+        if settings.get('headless'):
+            options.add_argument("-headless")
+            options.add_argument(f"--width={HEADLESS_WINDOW_SIZE[0]}")
+            options.add_argument(f"--height={HEADLESS_WINDOW_SIZE[1]}")
+        print("Opening Firefox...")
+    else:  # chrome
+        options.add_argument("--force-device-scale-factor=0.8")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-gpu")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        if settings.get('headless'):
+            options.add_argument("--headless=new")
+            options.add_argument(f"--window-size={HEADLESS_WINDOW_SIZE[0]},{HEADLESS_WINDOW_SIZE[1]}")
+        if settings.get('confirm_engine') == 'network': # DevTools network events for DeleteRequestWatcher
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+        print("Opening Chrome...")
+    driver = WebDriver(service=service, options=options)
+    if not settings.get('headless'):
+        driver.maximize_window()
+    return instrument_driver(driver)
+
+def driver_launch_key(settings): # the settings that change how a browser is launched, a warm driver is only reusable if these match
+    return (settings['browser'], bool(settings.get('headless')), settings['browser'] == "Chrome" and settings.get('confirm_engine') == 'network', settings.get('driver_path'))
+
+class DriverWarmup: # launches the browser and opens /login in the background while the user is still filling in the form
+    def __init__(self, settings):
+        self.key = driver_launch_key(settings)
+        self.driver = None
+        self.taken = False
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, args=(settings,))
+        self.thread.daemon = True
+        self.thread.start()
+    def _run(self, settings):
+        try:
+            driver = build_driver(settings)
+        except Exception as e:
+            print(f"Browser pre-warm failed, it will be started on demand: {e}")
+            return
+        try:
+            driver.get(f"{settings.get('base_url', BASE_URL)}/login") # primes the HTTP cache, login_to_twitter still loads a fresh login flow
+        except Exception:
+            pass
+        with self.lock:
+            if not self.taken:
+                self.driver = driver
+                return
+        driver.quit() # discarded while it was still launching
+    def take(self, settings): # hands over the warm driver if it was launched with matching options, waiting for it if still starting
+        if driver_launch_key(settings) != self.key:
+            self.discard()
+            return None
+        self.thread.join()
+        with self.lock:
+            self.taken = True
+            driver, self.driver = self.driver, None
+        if driver:
+            try:
+                driver.current_url # window may have been closed by hand while waiting
+            except Exception:
+                return None
+        return driver
+    def discard(self):
+        with self.lock:
+            self.taken = True
+            driver, self.driver = self.driver, None
+        if driver:
+            threading.Thread(target=driver.quit, daemon=True).start()
+
+def restore_session(driver, cookies, base_url=BASE_URL): # loads cookies from an existing login into this driver, then verifies with a single page load
+    browser_name = driver.capabilities.get('browserName', 'unknown')
+    driver.get(base_url)
+    for cookie in cookies:
+        cookie = {key: value for key, value in cookie.items() if key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')}
+        try:
+            driver.add_cookie(cookie)
+        except Exception: # cookies for other domains are rejected, the auth ones are all on x.com
+            continue
+    driver.get(f"{base_url}/home")
+    try:
+        WebDriverWait(driver, 10).until(lambda d: check_login_success(d, browser_name))
+        return True
+    except TimeoutException:
+        return False
+
+def session_path_for(handle):
+    return os.path.join(DATA_DIR, f"{handle.lower()}.session.json")
+
+def save_session(driver, path): # cookies are as good as the password, so the file is only readable by the current user
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as session_file:
+        json.dump(driver.get_cookies(), session_file)
+
+def sign_in(driver, wait, settings, pacer): # reuses a saved session when it is still valid, otherwise logs in through the form (and saves that session)
+    session_path = session_path_for(settings['handle'])
+    if settings.get('reuse_session') and os.path.exists(session_path):
+        print("Checking saved session...")
+        try: # an empty or corrupt file is treated like an expired session
+            with open(session_path, encoding='utf-8') as session_file:
+                cookies = json.load(session_file)
+            if not isinstance(cookies, list) or not all(isinstance(cookie, dict) for cookie in cookies):
+                raise ValueError("not a list of cookies")
+        except (OSError, ValueError) as e:
+            print(f"Saved session could not be read ({e}), logging in with credentials.")
+        else:
+            if restore_session(driver, cookies, settings.get('base_url', BASE_URL)):
+                print("✓ Saved session is valid, skipping login.")
+                return True
+            print("Saved session has expired, logging in with credentials.")
+    if not settings.get('password'):
+        print("No password given and no valid saved session.")
+        return False
+    if not login_to_twitter(driver, wait, settings["handle"], settings["password"], pacer, settings.get('base_url', BASE_URL)):
+        return False
+    if settings.get('reuse_session'):
+        save_session(driver, session_path)
+        print("Session saved for next time.")
+    return True
+
+def run_pooled_session(index, settings, driver, cookies, work_queue, feeding_done, budget, stats, journal, retries, pacer): # one pooled browser session draining the shared status id queue
+    log_context.prefix = f"[S{index}] "
+    owns_driver = driver is None
+    try:
+        if owns_driver:
+            driver = build_driver(settings)
+            wait = WebDriverWait(driver, 10)
+            print("Reusing login cookies...")
+            if not restore_session(driver, cookies, settings.get('base_url', BASE_URL)):
+                print("Shared session was rejected, logging in separately.")
+                if not login_to_twitter(driver, wait, settings["handle"], settings["password"], pacer, settings.get('base_url', BASE_URL)):
+                    raise Exception("Login failed.")
+        wait = WebDriverWait(driver, 10)
+        watcher = create_delete_watcher(driver, settings)
+        while not budget.exhausted():
+            try:
+                kind, *item = work_queue.get(timeout=1)
+            except queue.Empty:
+                if feeding_done.is_set():
+                    break
+                continue
+            if kind == 'window': # only queued in delete-all mode, so the budget never applies
+                process_search_window(driver, wait, settings, stats, journal, retries, pacer, watcher, *item)
+                continue
+            status_id = item[0]
+            if not budget.acquire():
+                break
+            status = 'ERROR'
+            try:
+                status = delete_status(driver, wait, settings, status_id, pacer, watcher)
+            finally:
+                budget.release(status)
+                handle_outcome(status, status_id, status_permalink(settings, status_id), stats, journal, retries)
+            if settings["num_to_delete"] == 0: # with a target, retries wait for the coordinator so the shared budget holds
+                drain_retries(driver, wait, settings, stats, journal, retries, pacer, watcher)
+    except Exception as e:
+        print(f"SESSION ERROR: {e}")
+    finally:
+        if owns_driver and driver:
+            driver.quit()
+        log_context.prefix = ""
+
+def iter_pool_work(settings, journal, resumed): # ('status', id) items from the archive or ('window', since, until) items, minus whatever the journal says is done
+    if settings.get('archive_path'):
+        for status_id in iter_status_ids(settings['archive_path']):
+            if journal.is_done(status_id): # skipped before it reaches the queue, no session has to visit it
+                resumed[0] += 1
+                continue
+            yield ('status', status_id)
+    else:
+        rules = rules_fingerprint(settings)
+        for since, until in iter_search_windows(settings):
+            if not journal.window_done(since, until, rules):
+                yield ('window', since, until)
+
+def run_session_pool(driver, settings, stats, stats_per_session, journal, retries, pacer): # fans archive status ids or date windows out to settings['sessions'] browser sessions sharing one login
+    cookies = driver.get_cookies()
+    budget = DeletionBudget(settings["num_to_delete"])
+    work_queue = queue.Queue(maxsize=settings['sessions'] * 2) # bounded so the archive keeps streaming instead of being read up front
+    feeding_done = threading.Event()
+    threads = []
+    for index in range(1, settings['sessions'] + 1):
+        session_stats = new_stats()
+        stats_per_session.append(session_stats)
+        thread = threading.Thread(
+            target=run_pooled_session,
+            args=(index, settings, driver if index == 1 else None, cookies, work_queue, feeding_done, budget, session_stats, journal, retries, pacer)
+        )
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+    print("DETWEETION COMMENCING...")
+    if settings.get('archive_path'):
+        print(f"ARCHIVE MODE — {settings['sessions']} parallel sessions on {os.path.basename(settings['archive_path'])}.")
+    else:
+        print(f"DATE WINDOW MODE — {settings['sessions']} parallel sessions, {settings.get('window_days') or SEARCH_WINDOW_DAYS}-day windows.")
+    resumed = [0]
+    try:
+        for item in iter_pool_work(settings, journal, resumed):
+            while not budget.exhausted() and any(thread.is_alive() for thread in threads):
+                try:
+                    work_queue.put(item, timeout=1)
+                    break
+                except queue.Full:
+                    continue
+            else:
+                break
+    finally:
+        feeding_done.set()
+        for thread in threads:
+            thread.join()
+        stats_per_session[0]['resumed'] += resumed[0]
+        for session_stats in stats_per_session: # aggregate pooled sessions into the session-wide counters
+            for key in stats:
+                stats[key] += session_stats[key]
+    if budget.exhausted():
+        print(f"Target ({settings['num_to_delete']}) deletions reached.")
+    elif settings.get('archive_path'):
+        print("Reached the end of the archive.")
+    else:
+        print("All date windows walked.")
 
-def run_detweeter_logic(settings, log_queue): # main worker function that runs in a separate thread
+def run_detweeter_logic(settings, log_queue, warmup=None): # main worker function, a separate thread under the GUI; returns the run's stats
     sys.stdout = QueueWriter(log_queue)
     driver = None
-    deleted_count = 0
-    skipped_count = 0
-    processed_count = 0
+    stats = new_stats()
+    stats_per_session = []
+    journal = None
+    retries = RetryQueue()
+    pacer = Pacer()
+    metrics.reset()
     try:
         print("Request received. Loading...")
-        if settings['browser'] == "Firefox":
-            service = FirefoxService(GeckoDriverManager().install())
-            options = FirefoxOptions()
-            options.set_preference("layout.css.devPixelsPerPx", "0.8")
-            print("Opening Firefox...")
-            driver = webdriver.Firefox(service=service, options=options)
-        else:  # chrome
-            service = ChromeService(ChromeDriverManager().install())
-            options = ChromeOptions()
-            options.add_argument("--force-device-scale-factor=0.8")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-gpu")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            print("Opening Chrome...")
-            driver = webdriver.Chrome(service=service, options=options)
-        driver.maximize_window()
+        os.makedirs(DATA_DIR, exist_ok=True)
+        if settings.get('rules'):
+            snapshot_script(settings) # compile up front so a bad rule fails before the browser starts
+            print(f"Rules active: {describe_rules(settings['rules'])}")
+        journal = ProgressJournal(settings.get('journal_path') or journal_path_for(settings['handle']))
+        if journal.index and not settings.get('plan'):
+            print(f"Resuming: {journal.done_count()} tweets already handled according to {journal.path}")
+        driver = warmup.take(settings) if warmup else None
+        if driver:
+            print("Using pre-warmed browser.")
+        else:
+            driver = build_driver(settings)
         wait = WebDriverWait(driver, 10)
-        if not login_to_twitter(driver, wait, settings["handle"], settings["password"]):
+        if not sign_in(driver, wait, settings, pacer):
             raise Exception("Login failed. Please check credentials and try again.")
-        profile_url = f"https://x.com/{settings['handle']}/with_replies"
-        print(f"Navigating to user profile...")
-        driver.get(profile_url)
-        long_wait = WebDriverWait(driver, 20)
-        long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"a[href='/{settings['handle']}']")))
-        print("DETWEETION COMMENCING...")
-        time.sleep(2)
-        if settings["num_to_delete"] == 0:
-            print("∞ MODE — ALL unbookmarked tweets.")
+        sessions = settings.get('sessions', 1)
+        windowed = settings.get('traversal') == 'search'
+        if settings.get('plan'):
+            if sessions > 1:
+                print("Plan mode reads in one session.")
+            run_plan(driver, wait, settings, stats, pacer)
+        elif sessions > 1 and (settings.get('archive_path') or (windowed and settings["num_to_delete"] == 0)):
+            run_session_pool(driver, settings, stats, stats_per_session, journal, retries, pacer)
+            watcher = create_delete_watcher(driver, settings) # session 1's watcher went with its thread
         else:
-            print(f"# MODE — {settings['num_to_delete']} most recent unbookmarked tweets.")
-        processed_permalinks = set()
-        stalls = 0
-        while True:
-            if settings["num_to_delete"] > 0 and deleted_count >= settings["num_to_delete"]:
-                print(f"Target ({settings['num_to_delete']}) deletions reached.")
-                break
-            tweets_on_page = driver.find_elements(*LOCATORS["TWEET_ARTICLE"])
-            if not tweets_on_page and stalls == 0:
-                print("No tweets found on initial load. Scrolling down to find some.")
-            found_new_tweet_this_pass = False
-            for tweet in tweets_on_page:
-                if settings["num_to_delete"] > 0 and deleted_count >= settings["num_to_delete"]:
-                    break # check again in case inner loop reached target
-                try:
-                    permalink_element = WebDriverWait(tweet, 2).until(
-                        EC.presence_of_element_located(LOCATORS["TWEET_PERMALINK"])
-                    )
-                    permalink = permalink_element.get_attribute('href')
-                    if permalink in processed_permalinks:
-                        continue
-                    found_new_tweet_this_pass = True
-                    processed_permalinks.add(permalink)
-                    status = process_tweet(tweet, settings, wait, driver)
-                    if status == 'DELETED':
-                        processed_count += 1
-                        deleted_count += 1
-                        print(f"TWEET DELETED — TOTAL THIS SESSION: {deleted_count}")
-                        time.sleep(0.5) # small pause for UI to settle
-                    elif status == 'SKIPPED_BOOKMARK':
-                        processed_count += 1
-                        skipped_count += 1
-                    elif status == 'ERROR':
-                        # An attempt was made on our tweet, but failed, so it's counted as processed
-                        processed_count += 1
-                    # if status is 'SKIPPED_AUTHOR', we do nothing and don't count it
-                except (NoSuchElementException, StaleElementReferenceException, TimeoutException):
-                    print("  - Could not process a tweet element, may have become stale or been an ad.")
-                    continue
-            else: # runs if the for loop completes without a break
-                if found_new_tweet_this_pass:
-                    stalls = 0
-                    print("Visible tweets have been processed. Scrolling...")
+            watcher = create_delete_watcher(driver, settings)
+            if settings.get('archive_path'):
+                delete_from_archive(driver, wait, settings, stats, journal, retries, pacer, watcher)
+            else:
+                if sessions > 1:
+                    print("Parallel sessions need archive mode, or date windows with Delete All; continuing with one session.")
+                if windowed:
+                    delete_by_search_windows(driver, wait, settings, stats, journal, retries, pacer, watcher)
                 else:
-                    stalls += 1
-                if stalls >= 3:
-                    print("Scrolling appears to have reached the end of timeline.")
-                    break
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                    delete_from_timeline(driver, wait, settings, stats, journal, retries, pacer, watcher)
+        if len(retries):
+            print(f"Retrying {len(retries)} failed deletions before finishing...")
+            drain_retries(driver, wait, settings, stats, journal, retries, pacer, watcher, final=True)
     except KeyboardInterrupt:
         print("Script interrupted by user.")
+        stats['error'] = "interrupted by user"
     except Exception as e:
         print(f"CRITICAL ERROR: {e}")
+        stats['error'] = str(e).strip() or type(e).__name__
     finally:
         print("\n" + "="*20)
         print(" DETWEETION SUMMARY")
         print("="*20)
-        print(f"Tweets Evaluated: {processed_count} by @{settings.get('handle', 'user')}")
-        print(f"Tweets Skipped:   {skipped_count}")
-        print(f"Tweets Deleted:   {deleted_count}")
+        print(f"Tweets Evaluated: {stats['processed']} by @{settings.get('handle', 'user')}")
+        print(f"Tweets Skipped:   {stats['skipped']}")
+        print(f"Tweets Deleted:   {stats['deleted']}")
+        if settings.get('plan'):
+            print(f"Tweets Planned:   {stats['planned']} (dry run)")
+        if settings.get('archive_path'):
+            print(f"Tweets Not Found: {stats['missing']}")
+        if stats['errors'] > stats['recovered']:
+            print(f"Tweets Failed:    {stats['errors'] - stats['recovered']}")
+        if stats['resumed']:
+            print(f"Tweets Resumed:   {stats['resumed']} (already handled in an earlier run)")
+        if stats['retried']:
+            print(f"Retry Attempts:   {stats['retried']}")
+        unresolved = retries.unresolved()
+        if unresolved:
+            print(f"Still failing ({len(unresolved)}), re-run to try again:")
+            for permalink in unresolved:
+                print(f"  {permalink}")
+        print(pacer.describe())
+        if len(stats_per_session) > 1:
+            for index, session_stats in enumerate(stats_per_session, start=1):
+                print(f"  Session {index}: {session_stats['deleted']} deleted, {session_stats['skipped']} skipped, {session_stats['processed']} evaluated")
+        print("="*20)
+        metrics.report(stats['deleted'])
+        try:
+            metrics_prefix = settings.get('metrics_path') or os.path.join(METRICS_DIR, f"{settings.get('handle', 'user').lower()}-{time.strftime('%Y%m%d-%H%M%S')}")
+            print(f"Timings exported to {metrics.export(metrics_prefix, stats['deleted'])} (+ .csv)")
+        except OSError as e:
+            print(f"Could not export timings: {e}")
         print("="*20)
         if driver:
             driver.quit()
+        if journal:
+            journal.close()
+        sys.stdout.flush()
         sys.stdout = sys.__stdout__
+    return stats
 
-if __name__ == "__main__":
+def load_gui_modules(): # tkinter and ctypes are only needed by the GUI, the CLI never imports them
+    global tk, messagebox, scrolledtext, filedialog, ctypes
+    import ctypes
+    import tkinter as tk
+    from tkinter import messagebox, scrolledtext, filedialog
+
+def run_gui():
+    load_gui_modules()
     root = tk.Tk()
     app = DetweeterApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+def startup_report(): # import time of this module, what it pulled in, and peak memory so far
+    elapsed = time.perf_counter() - STARTUP_STARTED
+    heavy = [name for name in ('tkinter', 'selenium.webdriver.remote.webdriver', 'selenium.webdriver.firefox.webdriver', 'selenium.webdriver.chrome.webdriver', 'webdriver_manager') if name in sys.modules]
+    report = f"Startup: {elapsed * 1000:.0f} ms, {len(sys.modules)} modules loaded (heavy: {', '.join(heavy) or 'none'})"
+    try:
+        import resource # POSIX only
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss # KiB on Linux, bytes on macOS
+        report += f", {peak / (1 << 20 if sys.platform == 'darwin' else 1 << 10):.1f} MB peak RSS"
+    except ImportError:
+        pass
+    import tracemalloc
+    if tracemalloc.is_tracing(): # PYTHONTRACEMALLOC=1 traces from interpreter start, so this is what the imports allocated
+        report += f", {tracemalloc.get_traced_memory()[1] / (1 << 20):.1f} MB allocated by imports"
+    return report
+
+CLI_SHARED_OPTIONS = ('count', 'browser', 'sessions', 'windows', 'since', 'window_days', 'rules', 'confirm', 'show_browser', 'no_saved_session', 'driver_path', 'plan') # command-line values that act as defaults for every --batch account
+ACCOUNT_OPTIONS = CLI_SHARED_OPTIONS + ('handle', 'archive', 'journal', 'metrics', 'plan_path', 'password_env') # keys an accounts file entry may use
+
+def cli_parser():
+    parser = argparse.ArgumentParser(prog="detweeter", description="Delete your tweets without the GUI. Run with no arguments to open the GUI instead.")
+    parser.add_argument("--handle", help="your @handle")
+    parser.add_argument("--count", type=int, help="number of tweets to delete, 0 deletes all unbookmarked tweets")
+    parser.add_argument("--browser", choices=["Firefox", "Chrome"], default="Firefox")
+    parser.add_argument("--sessions", type=int, default=1, help="parallel browser sessions (archive mode, or date windows with --count 0)")
+    parser.add_argument("--archive", help="tweets.js from your X archive or a plan manifest (.csv), visit those status ids instead of scrolling")
+    parser.add_argument("--windows", action="store_true", help="walk the profile in date windows via search")
+    parser.add_argument("--since", help=f"first day (YYYY-MM-DD) the date windows cover (default: {SEARCH_EPOCH})")
+    parser.add_argument("--window-days", type=int, help=f"days per date window (default: {SEARCH_WINDOW_DAYS})")
+    parser.add_argument("--rules", help="rules file narrowing which tweets are deleted")
+    parser.add_argument("--confirm", choices=["dom", "network"], default="dom", help="deletion confirmation engine (network needs Chrome)")
+    parser.add_argument("--show-browser", action="store_true", help="open a visible browser window instead of running headless")
+    parser.add_argument("--no-saved-session", action="store_true", help="always log in with the password instead of saved cookies")
+    parser.add_argument("--driver-path", help="local geckodriver/chromedriver binary, skips the driver download")
+    parser.add_argument("--journal", help="progress journal path (default: one per handle in ~/.detweeter)")
+    parser.add_argument("--metrics", help="path prefix for the exported timings")
+    parser.add_argument("--plan", action="store_true", help="dry run: delete nothing, write a manifest of what would be deleted")
+    parser.add_argument("--plan-path", help="where --plan writes its manifest (default: ~/.detweeter/plans)")
+    parser.add_argument("--batch", metavar="ACCOUNTS", help="JSON list of accounts to run in parallel worker processes, other options become their defaults")
+    parser.add_argument("--concurrency", type=int, default=2, help="accounts running at once with --batch (default: %(default)s)")
+    return parser
+
+def saved_login_available(handle, reuse_session):
+    return reuse_session and os.path.exists(session_path_for(handle))
+
+def settings_from_options(options, password): # command-line equivalent of DetweeterApp.start_deletion_process, for parsed arguments and accounts-file entries alike; raises ValueError
+    handle = str(options.get('handle') or '').strip().lstrip('@')
+    if not handle:
+        raise ValueError("a handle is required.")
+    count = options.get('count')
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ValueError("count must be 0 (all) or a positive number.")
+    sessions = options.get('sessions', 1)
+    if not isinstance(sessions, int) or sessions <= 0:
+        raise ValueError("sessions must be at least 1.")
+    browser = options.get('browser', "Firefox")
+    if browser not in ("Firefox", "Chrome"):
+        raise ValueError("browser must be Firefox or Chrome.")
+    confirm = options.get('confirm', 'dom')
+    if confirm not in ('dom', 'network'):
+        raise ValueError("confirm must be dom or network.")
+    since = options.get('since')
+    if since:
+        try:
+            datetime.date.fromisoformat(str(since))
+        except ValueError:
+            raise ValueError("since must be a YYYY-MM-DD date.")
+    window_days = options.get('window_days')
+    if window_days is not None and (not isinstance(window_days, int) or isinstance(window_days, bool) or window_days <= 0):
+        raise ValueError("window_days must be a positive number.")
+    archive = options.get('archive')
+    if archive and not os.path.isfile(archive):
+        raise ValueError(f"archive file not found: {archive}")
+    if archive and options.get('plan'):
+        raise ValueError("plan mode walks the profile, an archive or manifest already lists what to delete.")
+    reuse_session = not options.get('no_saved_session')
+    if not password and not saved_login_available(handle, reuse_session):
+        raise ValueError(f"no password for @{handle} and no saved session.")
+    rules = None
+    if options.get('rules'):
+        try:
+            rules = load_rules(options['rules'])
+        except (OSError, ValueError) as e:
+            raise ValueError(f"could not use rules file: {e}")
+    return {
+        'handle': handle,
+        'password': password,
+        'num_to_delete': count,
+        'browser': browser,
+        'archive_path': archive,
+        'sessions': sessions,
+        'confirm_engine': confirm,
+        'headless': not options.get('show_browser'),
+        'reuse_session': reuse_session,
+        'traversal': 'search' if options.get('windows') else 'profile',
+        'search_since': str(since) if since else None,
+        'window_days': window_days,
+        'rules': rules,
+        'driver_path': options.get('driver_path'),
+        'journal_path': options.get('journal'),
+        'metrics_path': options.get('metrics'),
+        'plan': bool(options.get('plan')),
+        'plan_path': options.get('plan_path')
+    }
+
+def pump_log(log_queue, file_log, stop, echo=True): # CLI counterpart of DetweeterApp.drain_log_queue: log file, plus the terminal when echo is set
+    while not (stop.is_set() and log_queue.empty()):
+        try:
+            messages = [log_queue.get(timeout=0.1)]
+        except queue.Empty:
+            continue
+        while True:
+            try:
+                messages.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        batch = ''.join(messages)
+        file_log.info(batch)
+        if echo:
+            sys.__stdout__.write(batch) # sys.stdout is the QueueWriter while a run is active
+            sys.__stdout__.flush()
+
+def run_logged(settings, file_log, echo=True): # runs on the calling thread, so Ctrl+C reaches run_detweeter_logic's KeyboardInterrupt handler
+    log_queue = queue.Queue()
+    stop = threading.Event()
+    pump = threading.Thread(target=pump_log, args=(log_queue, file_log, stop, echo), daemon=True)
+    pump.start()
+    try:
+        return run_detweeter_logic(settings, log_queue)
+    finally:
+        stop.set()
+        pump.join()
+
+def run_cli(argv):
+    parser = cli_parser()
+    args = parser.parse_args(argv)
+    if args.batch:
+        return run_batch_cli(args)
+    if args.handle is None or args.count is None:
+        parser.error("--handle and --count are required (or --batch ACCOUNTS).")
+    password = os.environ.get("DETWEETER_PASSWORD", "") # keeps the password out of shell history and crontabs
+    if not password and not saved_login_available(args.handle.strip().lstrip('@'), not args.no_saved_session):
+        if not sys.stdin.isatty():
+            parser.error("set DETWEETER_PASSWORD, or log in once so a saved session exists.")
+        password = getpass.getpass(f"Password for @{args.handle}: ")
+    try:
+        settings = settings_from_options(vars(args), password)
+    except ValueError as e:
+        parser.error(str(e))
+    print(startup_report())
+    stats = run_logged(settings, open_file_log())
+    return 1 if stats.get('error') else 0
+
+def load_accounts(path): # accounts file: a JSON list of objects keyed by ACCOUNT_OPTIONS, e.g. [{"handle": "one", "count": 0, "browser": "Chrome"}]
+    with open(path, encoding='utf-8') as f:
+        accounts = json.load(f)
+    if not isinstance(accounts, list) or not all(isinstance(account, dict) for account in accounts):
+        raise ValueError("Accounts file must contain a JSON list of objects.")
+    for account in accounts:
+        unknown = set(account) - set(ACCOUNT_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown account option(s): {', '.join(sorted(unknown))}")
+    return accounts
+
+def password_env_for(handle): # default environment variable holding an account's password in batch mode
+    return "DETWEETER_PASSWORD_" + re.sub(r'\W', '_', handle).upper()
+
+def account_log_path(handle):
+    return os.path.join(os.path.dirname(LOG_FILE_PATH), f"{handle.lower()}.log")
+
+def run_account(settings, conn): # batch worker process: one account with its own driver, journal and log file, stats go back over conn
+    file_log = open_file_log(account_log_path(settings['handle']), f"detweeter.{settings['handle'].lower()}")
+    conn.send(run_logged(settings, file_log, echo=False))
+    conn.close()
+
+def run_batch(jobs, concurrency): # runs each settings dict in its own process, at most concurrency at a time; returns [(handle, stats, seconds)]
+    import multiprocessing
+    import multiprocessing.connection
+    pending = collections.deque(jobs)
+    running = {} # conn -> (process, settings, started)
+    results = []
+    interrupted = False
+    while running or (pending and not interrupted):
+        try:
+            while pending and not interrupted and len(running) < concurrency:
+                settings = pending.popleft()
+                conn, child_conn = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=run_account, args=(settings, child_conn), name=f"detweeter-{settings['handle']}")
+                process.start()
+                child_conn.close()
+                running[conn] = (process, settings, time.monotonic())
+                print(f"Started @{settings['handle']} (log: {account_log_path(settings['handle'])})")
+            ready = multiprocessing.connection.wait(list(running) + [process.sentinel for process, _, _ in running.values()]) # the stats arriving, or the worker exiting without them
+        except KeyboardInterrupt: # the workers got the Ctrl+C too and are wrapping up, collect their stats
+            interrupted = True
+            print("Interrupted, waiting for running accounts to finish their summaries...")
+            continue
+        for conn, (process, settings, started) in list(running.items()):
+            if conn not in ready and process.sentinel not in ready:
+                continue
+            del running[conn]
+            try: # received before joining, a report larger than the pipe buffer would otherwise keep the worker blocked in send
+                stats = conn.recv()
+            except EOFError: # crashed before it could report, the other accounts carry on
+                stats = new_stats()
+                stats['error'] = f"worker exited with code {process.exitcode}"
+            conn.close()
+            process.join()
+            results.append((settings['handle'], stats, time.monotonic() - started))
+            print(f"Finished @{settings['handle']}: {stats['deleted']} deleted" + (f", {stats['error'].splitlines()[0]}" if stats.get('error') else ""))
+    for settings in pending:
+        stats = new_stats()
+        stats['error'] = "not started (interrupted)"
+        results.append((settings['handle'], stats, 0.0))
+    return results
+
+def print_batch_summary(results, elapsed):
+    print("\n" + "="*20)
+    print(" BATCH SUMMARY")
+    print("="*20)
+    print(f"{'account':<17} {'evaluated':>9} {'planned':>7} {'deleted':>7} {'skipped':>7} {'failed':>6} {'resumed':>7} {'time':>7}  result")
+    for handle, stats, seconds in results:
+        print(f"{'@' + handle:<17} {stats['processed']:>9} {stats['planned']:>7} {stats['deleted']:>7} {stats['skipped']:>7} {stats['errors'] - stats['recovered']:>6} {stats['resumed']:>7} {seconds:>6.0f}s  {(stats.get('error') or 'ok').splitlines()[0]}")
+    failed = sum(1 for _, stats, _ in results if stats.get('error'))
+    deleted = sum(stats['deleted'] for _, stats, _ in results)
+    print(f"{len(results)} accounts, {failed} failed, {deleted} tweets deleted in {elapsed:.0f}s ({deleted / elapsed * 60 if elapsed else 0.0:.1f}/min)")
+    print("="*20)
+
+def run_batch_cli(args):
+    try:
+        accounts = load_accounts(args.batch)
+    except (OSError, ValueError) as e:
+        print(f"Could not read accounts file: {e}")
+        return 2
+    if args.concurrency <= 0:
+        print("--concurrency must be at least 1.")
+        return 2
+    print(startup_report())
+    defaults = {key: value for key, value in vars(args).items() if key in CLI_SHARED_OPTIONS and value is not None}
+    jobs = []
+    results = []
+    seen = set()
+    for account in accounts:
+        options = {**defaults, **account}
+        handle = str(options.get('handle') or '').strip().lstrip('@')
+        password_env = options.get('password_env') or password_env_for(handle)
+        password = os.environ.get(password_env, "")
+        try:
+            if handle.lower() in seen: # would share a journal and session file with the other run
+                raise ValueError("listed more than once.")
+            if handle and not password and not saved_login_available(handle, not options.get('no_saved_session')):
+                raise ValueError(f"set {password_env}, or log in once so a saved session exists.")
+            seen.add(handle.lower())
+            jobs.append(settings_from_options(options, password))
+        except ValueError as e:
+            stats = new_stats()
+            stats['error'] = str(e)
+            results.append((handle or '?', stats, 0.0))
+            print(f"Skipping @{handle or '?'}: {e}")
+    for browser in {settings['browser'] for settings in jobs if not settings['driver_path']}: # resolve once here, not one download per worker
+        try:
+            driver_path, _ = resolve_driver_path({'browser': browser})
+        except Exception as e:
+            print(f"Could not prepare the {browser} driver up front ({e}), each account will try on its own.")
+            continue
+        for settings in jobs:
+            if settings['browser'] == browser and not settings['driver_path']:
+                settings['driver_path'] = driver_path
+    started = time.monotonic()
+    results += run_batch(jobs, args.concurrency)
+    print_batch_summary(results, time.monotonic() - started)
+    return 1 if any(stats.get('error') for _, stats, _ in results) else 0
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        import multiprocessing
+        multiprocessing.freeze_support() # batch workers in a frozen Windows build
+        sys.exit(run_cli(sys.argv[1:]))
+    run_gui()
\ No newline at end of file